@@ -255,7 +255,7 @@ class Events(commands.Cog):
                 f"Starting events monitor for server {server_id}..."
             , guild=guild_model)
             from utils.discord_utils import hybrid_send
-            message = await hybrid_send(ctx, embed=embed)
+            message = await hybrid_send(ctx, embed=embed, return_message=True)
 
             # Start the task
             task = asyncio.create_task(
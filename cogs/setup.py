@@ -147,7 +147,7 @@ class Setup(commands.Cog):
                 "Adding Server",
                 f"Testing connection to {server_name}..."
             , guild=guild_model)
-            message = await hybrid_send(ctx, embed=embed)
+            message = await hybrid_send(ctx, embed=embed, return_message=True)
 
             # Create SFTP client to test connection
             # For new server setup, we check if the server_id is numeric or a UUID
@@ -0,0 +1,153 @@
+"""
+Tests for the command error dispatch tables
+
+This script checks that errors resolve to the right handler through the
+shared dispatch in utils.error_handlers, that each entry point keeps its own
+wording, and that handle_command_error only claims the errors it handles.
+"""
+import inspect
+import os
+import sys
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+import discord
+from discord.ext import commands
+
+from utils.error_handlers import get_error_handler, handle_command_error
+
+class MockCommand:
+    """Minimal command with a name and signature"""
+
+    def __init__(self, guild_only=False):
+        self.name = "ping"
+        self.qualified_name = "ping"
+        self.signature = "<target>"
+        self.guild_only = guild_only
+
+    def __str__(self):
+        return self.name
+
+class MockSource:
+    """Minimal context-like object for calling handlers directly"""
+
+    def __init__(self, command=None):
+        self.prefix = "!"
+        self.command = command or MockCommand()
+
+def _dispatch(error, embed=None):
+    """Resolve and run the handler for an error"""
+    handler = get_error_handler(error, embed=embed is not None)
+    if handler is None:
+        return None
+    return handler(MockSource(), error, embed)
+
+def _missing_argument():
+    """Build a MissingRequiredArgument for a parameter named target"""
+    param = inspect.Parameter("target", inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    return commands.MissingRequiredArgument(param)
+
+class ErrorDispatchTests(unittest.TestCase):
+    """Tests for get_error_handler and the handler tables"""
+
+    def test_cooldown_wording(self):
+        """Each entry point keeps its own cooldown text."""
+        error = commands.CommandOnCooldown(commands.Cooldown(1, 10), 3.2, commands.BucketType.user)
+
+        message, _ = _dispatch(error)
+        self.assertEqual(message, "This command is on cooldown. Please try again in 3 seconds.")
+
+        message, _ = _dispatch(error, discord.Embed())
+        self.assertEqual(message, "This command is on cooldown. Try again in 3.2s.")
+
+    def test_permission_names(self):
+        """Embed replies use readable permission names, plain replies the flags."""
+        error = commands.MissingPermissions(["manage_guild"])
+
+        message, _ = _dispatch(error)
+        self.assertIn("`manage_guild`", message)
+
+        message, _ = _dispatch(error, discord.Embed())
+        self.assertIn("Manage Server", message)
+
+    def test_missing_argument_usage(self):
+        """The usage line is built from the command name and signature."""
+        error = _missing_argument()
+
+        message, _ = _dispatch(error)
+        self.assertEqual(message, "Missing required argument: `target`.\nUsage: `!ping <target>`")
+
+        embed = discord.Embed()
+        message, embed = _dispatch(error, embed)
+        self.assertEqual(message, "Missing required argument: `target`")
+        self.assertEqual(embed.fields[0].name, "Usage")
+        self.assertEqual(embed.fields[0].value, "`!ping <target>`")
+
+    def test_check_failures(self):
+        """Guild-only failures are handled, other check failures are left alone."""
+        message, _ = _dispatch(commands.NoPrivateMessage())
+        self.assertEqual(message, "This command can only be used in a server, not in DMs.")
+        self.assertIsNone(_dispatch(commands.CheckFailure("nope")))
+
+        message, _ = _dispatch(commands.CheckFailure("nope"), discord.Embed())
+        self.assertEqual(message, "You do not have permission to use this command.")
+        message, _ = _dispatch(commands.NoPrivateMessage(), discord.Embed())
+        self.assertEqual(message, "Command `ping` cannot be used in private messages.")
+
+    def test_handled_sets(self):
+        """Only the embed listener handles disabled commands and parsing errors."""
+        for error in (commands.DisabledCommand("off"), commands.ArgumentParsingError("bad quote")):
+            self.assertIsNone(get_error_handler(error))
+            self.assertIsNotNone(get_error_handler(error, embed=True))
+
+        self.assertIsNone(get_error_handler(RuntimeError("unexpected")))
+        self.assertIsNone(get_error_handler(RuntimeError("unexpected"), embed=True))
+
+    def test_subclass_resolution(self):
+        """Subclasses resolve to the most specific registered handler."""
+        error = commands.MemberNotFound("someone")
+        message, _ = _dispatch(error)
+        self.assertTrue(message.startswith("Invalid argument:"))
+
+class HandleCommandErrorTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for handle_command_error delivering dispatch results"""
+
+    def _context(self, command=None):
+        ctx = MagicMock(spec=commands.Context)
+        ctx.command = command or MockCommand()
+        ctx.prefix = "!"
+        ctx.guild = None
+        ctx.channel = MagicMock()
+        ctx.author = "tester"
+        ctx.send = AsyncMock()
+        return ctx
+
+    async def test_handled_error_replies(self):
+        """Handled errors are sent to the context and reported as handled."""
+        ctx = self._context()
+        handled = await handle_command_error(ctx, commands.MissingPermissions(["manage_guild"]))
+
+        self.assertTrue(handled)
+        ctx.send.assert_awaited_once()
+        self.assertIn("`manage_guild`", ctx.send.await_args.args[0])
+
+    async def test_guild_only_command(self):
+        """A check failure on a guild-only command gets the guild-only message."""
+        ctx = self._context(MockCommand(guild_only=True))
+        handled = await handle_command_error(ctx, commands.CheckFailure("nope"))
+
+        self.assertTrue(handled)
+        self.assertEqual(ctx.send.await_args.args[0], "This command can only be used in a server, not in DMs.")
+
+    async def test_unhandled_error_propagates(self):
+        """Errors without a plain-reply handler are not answered."""
+        for error in (commands.CheckFailure("nope"), commands.DisabledCommand("off")):
+            ctx = self._context()
+            self.assertFalse(await handle_command_error(ctx, error))
+            ctx.send.assert_not_awaited()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,6 +8,7 @@ import asyncio
 import logging
 import sys
 import os
+import unittest
 import datetime
 import hashlib
 from typing import Dict, Any, Optional
@@ -21,7 +22,7 @@ logger = logging.getLogger("test_error_telemetry")
 
 # Import the error telemetry system
 try:
-    from utils.error_telemetry import ErrorTelemetry, categorize_error, get_error_fingerprint
+    from utils.error_telemetry import ErrorTelemetry, categorize_error, get_error_fingerprint, _state
     logger.info("Successfully imported error telemetry")
 except ImportError as e:
     logger.error(f"Failed to import error telemetry: {e}")
@@ -89,27 +90,7 @@ class MockCollection:
                     break
             
             if match:
-                # Apply update
-                if "$set" in update:
-                    for k, v in update["$set"].items():
-                        doc[k] = v
-                
-                if "$inc" in update:
-                    for k, v in update["$inc"].items():
-                        if k not in doc:
-                            doc[k] = v
-                        else:
-                            doc[k] += v
-                
-                if "$push" in update:
-                    for k, v in update["$push"].items():
-                        if k not in doc:
-                            doc[k] = [v]
-                        else:
-                            if not isinstance(doc[k], list):
-                                doc[k] = [doc[k]]
-                            doc[k].append(v)
-                
+                self._apply_update(doc, update)
                 self.data[i] = doc
                 return MockUpdateResult(1, 1)
         
@@ -119,14 +100,55 @@ class MockCollection:
             for k, v in query.items():
                 new_doc[k] = v
             
-            if "$set" in update:
-                for k, v in update["$set"].items():
+            if "$setOnInsert" in update:
+                for k, v in update["$setOnInsert"].items():
                     new_doc[k] = v
             
+            self._apply_update(new_doc, update)
             self.data.append(new_doc)
             return MockUpdateResult(0, 0, new_doc.get("_id", "upsert_id"))
         
         return MockUpdateResult(0, 0)
+    
+    async def bulk_write(self, operations, ordered=True):
+        # Apply each UpdateOne through update_one
+        for op in operations:
+            await self.update_one(op._filter, op._doc, upsert=op._upsert)
+        return MockBulkWriteResult(len(operations))
+    
+    @staticmethod
+    def _apply_update(doc, update):
+        """Apply $set, $inc and $push (including $each/$slice) to a document"""
+        if "$set" in update:
+            for k, v in update["$set"].items():
+                doc[k] = v
+        
+        if "$inc" in update:
+            for k, v in update["$inc"].items():
+                if k not in doc:
+                    doc[k] = v
+                else:
+                    doc[k] += v
+        
+        if "$push" in update:
+            for k, v in update["$push"].items():
+                if k not in doc:
+                    doc[k] = []
+                elif not isinstance(doc[k], list):
+                    doc[k] = [doc[k]]
+                
+                if isinstance(v, dict) and "$each" in v:
+                    doc[k].extend(v["$each"])
+                    if "$slice" in v:
+                        doc[k] = doc[k][v["$slice"]:]
+                else:
+                    doc[k].append(v)
+
+class FailingCollection(MockCollection):
+    """Mock collection whose bulk writes always fail"""
+    
+    async def bulk_write(self, operations, ordered=True):
+        raise ConnectionError("Database unavailable")
 
 class MockInsertResult:
     """Mock result of insert operation"""
@@ -134,6 +156,12 @@ class MockInsertResult:
     def __init__(self, inserted_id):
         self.inserted_id = inserted_id
 
+class MockBulkWriteResult:
+    """Mock result of bulk write operation"""
+    
+    def __init__(self, modified_count):
+        self.modified_count = modified_count
+
 class MockUpdateResult:
     """Mock result of update operation"""
     
@@ -191,5 +219,115 @@ async def test_error_telemetry():
     
     logger.info("Error telemetry tests completed successfully!")
 
+def _raise_repeated_error():
+    """Raise the same error from the same place so every call shares a fingerprint"""
+    raise ValueError("Repeated error")
+
+async def _track_repeated_errors(count):
+    """Track the repeated error count times and return its fingerprint"""
+    fingerprint = None
+    for _ in range(count):
+        try:
+            _raise_repeated_error()
+        except ValueError as e:
+            fingerprint = get_error_fingerprint(e)
+            await ErrorTelemetry.track_error(e, category="test_category")
+    return fingerprint
+
+def _reset_telemetry(db):
+    """Point the telemetry at db and empty its buffer"""
+    ErrorTelemetry(db)
+    _state.db = db
+    _state.enabled = True
+    _state.buffer.clear()
+    _state.formatted_fingerprints.clear()
+
+class ErrorTelemetryBufferTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for the telemetry buffer, flush and re-queue paths"""
+    
+    async def test_flush_error_buffer(self):
+        """Buffered duplicates are aggregated into one bulk upsert."""
+        db = MockDatabase()
+        _reset_telemetry(db)
+        
+        fingerprint = await _track_repeated_errors(3)
+        self.assertEqual(len(_state.buffer), 3, "All occurrences should be buffered")
+        
+        self.assertTrue(await ErrorTelemetry.flush_error_buffer(), "Flush should succeed")
+        self.assertFalse(_state.buffer, "Flush should empty the buffer")
+        self.assertFalse(_state.formatted_fingerprints, "Flush should reset formatted fingerprints")
+        
+        docs = [doc for doc in db.errors.data if doc["fingerprint"] == fingerprint]
+        self.assertEqual(len(docs), 1, "Duplicates should be stored as one record")
+        self.assertEqual(docs[0]["occurrence_count"], 3, "Occurrences should be counted")
+        self.assertEqual(len(docs[0]["recent_occurrences"]), 3, "Each occurrence should be pushed")
+        self.assertTrue(docs[0]["last_traceback"].startswith("Traceback"), "The traceback should be stored")
+    
+    async def test_failed_flush_requeues(self):
+        """A failed flush puts the records back in the buffer."""
+        db = MockDatabase()
+        db.errors = FailingCollection()
+        _reset_telemetry(db)
+        
+        fingerprint = await _track_repeated_errors(2)
+        
+        self.assertFalse(await ErrorTelemetry.flush_error_buffer(), "Flush should report the failure")
+        self.assertEqual(len(_state.buffer), 2, "Records should be re-queued")
+        self.assertIn(fingerprint, _state.formatted_fingerprints, "Re-queued traceback should be tracked")
+        
+        # A full buffer stays bounded across failed flushes
+        await _track_repeated_errors(_state.buffer.maxlen)
+        self.assertEqual(len(_state.buffer), _state.buffer.maxlen, "The buffer should stay bounded")
+        self.assertFalse(await ErrorTelemetry.flush_error_buffer())
+        self.assertEqual(len(_state.buffer), _state.buffer.maxlen, "Re-queue should not exceed the buffer size")
+    
+    async def test_traceback_preserved(self):
+        """Losing the traceback record does not blank the stored traceback."""
+        db = MockDatabase()
+        _reset_telemetry(db)
+        
+        fingerprint = await _track_repeated_errors(1)
+        self.assertTrue(await ErrorTelemetry.flush_error_buffer())
+        stored = db.errors.data[0]["last_traceback"]
+        self.assertTrue(stored, "The first flush should store a traceback")
+        
+        # Duplicates whose traceback record was dropped are flushed without one
+        await _track_repeated_errors(3)
+        _state.buffer.popleft()
+        self.assertTrue(all(not record["traceback"] for record in _state.buffer))
+        self.assertTrue(await ErrorTelemetry.flush_error_buffer())
+        
+        doc = db.errors.data[0]
+        self.assertEqual(doc["occurrence_count"], 3, "Remaining duplicates should be counted")
+        self.assertEqual(doc["last_traceback"], stored, "The stored traceback should be kept")
+        
+        # Evicting the record that carries the traceback lets the next one format it
+        _state.db = None  # Keep the records buffered so the buffer overflows
+        await _track_repeated_errors(1)
+        for _ in range(_state.buffer.maxlen):
+            await ErrorTelemetry.track_error("Filler error", category="test_category")
+        self.assertNotIn(fingerprint, _state.formatted_fingerprints, "Evicted traceback should be forgotten")
+        await _track_repeated_errors(1)
+        self.assertTrue(_state.buffer[-1]["traceback"], "The next occurrence should carry a traceback")
+    
+    async def test_chained_traceback(self):
+        """The stored traceback includes the cause of a wrapped error."""
+        db = MockDatabase()
+        _reset_telemetry(db)
+        
+        try:
+            try:
+                _raise_repeated_error()
+            except ValueError as e:
+                raise RuntimeError("Wrapped error") from e
+        except RuntimeError as e:
+            await ErrorTelemetry.track_error(e, category="test_category")
+        
+        stored = _state.buffer[-1]["traceback"]
+        self.assertIn("_raise_repeated_error", stored, "The cause's frames should be stored")
+        self.assertIn("direct cause of the following exception", stored)
+        self.assertTrue(stored.endswith("RuntimeError: Wrapped error"), "The outer error should come last")
+
 if __name__ == "__main__":
-    asyncio.run(test_error_telemetry())
\ No newline at end of file
+    asyncio.run(test_error_telemetry())
+    unittest.main()
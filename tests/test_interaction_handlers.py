@@ -0,0 +1,122 @@
+"""
+Tests for concurrent responses on one interaction
+
+This script checks that the per-interaction response lock in
+utils.interaction_handlers lets exactly one caller send the initial
+response or defer, and that everyone else falls back to a followup.
+"""
+import asyncio
+import os
+import sys
+import unittest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from utils.interaction_handlers import (
+    _RESPONSE_LOCKS,
+    defer_interaction,
+    hybrid_send,
+    safely_respond_to_interaction
+)
+
+class MockResponse:
+    """Interaction response that, like Discord, is only done once the request completes"""
+
+    def __init__(self):
+        self.done = False
+        self.sent = []
+        self.deferred = 0
+
+    def is_done(self):
+        return self.done
+
+    async def _acknowledge(self):
+        if self.done:
+            raise RuntimeError("This interaction has already been responded to")
+        # Yield to the loop like the API round-trip would
+        await asyncio.sleep(0)
+        self.done = True
+
+    async def send_message(self, **kwargs):
+        await self._acknowledge()
+        self.sent.append(kwargs)
+
+    async def defer(self, **kwargs):
+        await self._acknowledge()
+        self.deferred += 1
+
+class MockFollowup:
+    """Followup webhook that records what was sent"""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, **kwargs):
+        self.sent.append(kwargs)
+        return kwargs
+
+class MockInteraction:
+    """Minimal interaction with a response and a followup"""
+
+    def __init__(self):
+        self.response = MockResponse()
+        self.followup = MockFollowup()
+
+class ConcurrentResponseTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for the per-interaction response lock"""
+
+    async def test_concurrent_responses(self):
+        """Only one concurrent response is the initial one, the rest are followups."""
+        interaction = MockInteraction()
+        results = await asyncio.gather(*(
+            safely_respond_to_interaction(interaction, f"message {i}") for i in range(3)
+        ))
+
+        self.assertEqual(results, [True, True, True])
+        self.assertEqual(len(interaction.response.sent), 1)
+        self.assertEqual(len(interaction.followup.sent), 2)
+        self.assertNotIn(id(interaction), _RESPONSE_LOCKS)
+
+    async def test_defer_and_send(self):
+        """A defer and a send on the same interaction do not race."""
+        interaction = MockInteraction()
+        deferred, sent = await asyncio.gather(
+            defer_interaction(interaction),
+            safely_respond_to_interaction(interaction, "done")
+        )
+
+        self.assertTrue(deferred)
+        self.assertTrue(sent)
+        self.assertEqual(interaction.response.deferred, 1)
+        self.assertEqual(interaction.response.sent, [])
+        self.assertEqual(interaction.followup.sent, [{'content': 'done', 'ephemeral': False}])
+
+    async def test_send_then_defer(self):
+        """Deferring after a concurrent send is skipped instead of failing."""
+        interaction = MockInteraction()
+        sent, deferred = await asyncio.gather(
+            safely_respond_to_interaction(interaction, "done"),
+            defer_interaction(interaction)
+        )
+
+        self.assertTrue(sent)
+        self.assertFalse(deferred)
+        self.assertEqual(len(interaction.response.sent), 1)
+        self.assertEqual(interaction.response.deferred, 0)
+
+    async def test_concurrent_hybrid_send(self):
+        """hybrid_send shares the lock and returns the followup message."""
+        interaction = MockInteraction()
+        first, second = await asyncio.gather(
+            hybrid_send(interaction, "first"),
+            hybrid_send(interaction, "second")
+        )
+
+        self.assertIsNone(first)
+        self.assertEqual(second, {'content': 'second', 'ephemeral': False})
+        self.assertEqual(interaction.response.sent, [{'content': 'first', 'ephemeral': False}])
+        self.assertEqual(_RESPONSE_LOCKS, {})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,6 +5,7 @@ This module provides utility functions for importing commands and determining
 compatibility with different Discord library versions.
 """
 
+import functools
 import logging
 import sys
 import re
@@ -13,10 +14,14 @@ from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union, c
 
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=None)
 def is_compatible_with_pycord_261() -> bool:
     """
     Check if we're running with py-cord 2.6.1
     
+    The installed library can't change while the process runs, so the
+    result is computed once and cached.
+    
     Returns:
         bool: True if running with py-cord 2.6.1, False otherwise
     """
@@ -4,12 +4,13 @@ Discord utility functions for cogs
 
 import logging
 import asyncio
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Union
 
-import discord
 from discord.ext import commands
 
 from utils.safe_mongodb import SafeMongoDBResult, SafeDocument
+# Interaction responses live in utils.interaction_handlers; re-exported for cogs
+from utils.interaction_handlers import defer_interaction, hybrid_send, safely_respond_to_interaction
 
 logger = logging.getLogger(__name__)
 
@@ -51,59 +52,6 @@ async def command_handler(coro, *args, **kwargs):
         logger.error(f"Error in command_handler: {e}")
         raise
 
-async def defer_interaction(interaction):
-    """
-    Safely defer an interaction with error handling
-    
-    Args:
-        interaction: The interaction to defer
-        
-    Returns:
-        True if deferred successfully, False otherwise
-    """
-    try:
-        if not interaction.response.is_done():
-            await interaction.response.defer()
-            return True
-    except Exception as e:
-        logger.error(f"Failed to defer interaction: {e}")
-    return False
-
-async def safely_respond_to_interaction(
-    interaction, 
-    message: str, 
-    ephemeral: bool = False, 
-    embed: Optional[discord.Embed] = None
-):
-    """
-    Safely respond to an interaction with error handling
-    
-    Args:
-        interaction: The interaction to respond to
-        message: The message to send
-        ephemeral: Whether the response should be ephemeral
-        embed: Optional embed to send
-        
-    Returns:
-        True if responded successfully, False otherwise
-    """
-    try:
-        if not interaction.response.is_done():
-            if embed:
-                await interaction.response.send_message(message, ephemeral=ephemeral, embed=embed)
-            else:
-                await interaction.response.send_message(message, ephemeral=ephemeral)
-            return True
-        else:
-            if embed:
-                await interaction.followup.send(message, ephemeral=ephemeral, embed=embed)
-            else:
-                await interaction.followup.send(message, ephemeral=ephemeral)
-            return True
-    except Exception as e:
-        logger.error(f"Failed to respond to interaction: {e}")
-        return False
-
 async def db_operation(db_func, *args, **kwargs):
     """
     Wrapper for database operations with proper error handling
@@ -120,4 +68,10 @@ async def db_operation(db_func, *args, **kwargs):
         return await db_func(*args, **kwargs)
     except Exception as e:
         logger.error(f"Error in db_operation: {e}")
-        return SafeMongoDBResult.error_result(f"Database error: {e}")
\ No newline at end of file
+        return SafeMongoDBResult.error_result(f"Database error: {e}")
+
+# Export for easy importing
+__all__ = [
+    'server_id_autocomplete', 'command_handler', 'db_operation',
+    'defer_interaction', 'hybrid_send', 'safely_respond_to_interaction'
+]
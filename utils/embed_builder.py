@@ -275,8 +275,9 @@ class EmbedBuilder:
         
         # Add fields if provided is not None
         if fields is not None:
+            add_field = embed.add_field
             for field in fields:
-                embed.add_field(
+                add_field(
                     name=field["name"],
                     value=field["value"],
                     inline=field.get("inline", False)
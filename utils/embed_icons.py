@@ -88,6 +88,14 @@ async def send_embed_with_icon(ctx_or_channel, embed: discord.Embed, icon_path:
     Returns:
         discord.Message: The sent message or None if failed
     """
+    # Resolve the send target once: contexts/channels send directly,
+    # interactions through their followup webhook
+    send = getattr(ctx_or_channel, 'send', None)
+    if send is None:
+        send = getattr(getattr(ctx_or_channel, 'followup', None), 'send', None)
+        if send is None:
+            return None
+    
     try:
         # Create the file for the icon if a path is provided
         file = None
@@ -97,25 +105,13 @@ async def send_embed_with_icon(ctx_or_channel, embed: discord.Embed, icon_path:
             add_icon_to_embed(embed, icon_path)
         
         # Send the message with the file if available
-        if hasattr(ctx_or_channel, 'send'):
-            if file is not None:
-                return await ctx_or_channel.send(embed=embed, file=file, **kwargs)
-            else:
-                return await ctx_or_channel.send(embed=embed, **kwargs)
-        elif hasattr(ctx_or_channel, 'followup'):
-            if file is not None:
-                return await ctx_or_channel.followup.send(embed=embed, file=file, **kwargs)
-            else:
-                return await ctx_or_channel.followup.send(embed=embed, **kwargs)
-        return None
+        if file is not None:
+            return await send(embed=embed, file=file, **kwargs)
+        return await send(embed=embed, **kwargs)
     except Exception as e:
         # Fall back to sending without the file if there's an error
         try:
-            if hasattr(ctx_or_channel, 'send'):
-                return await ctx_or_channel.send(embed=embed, **kwargs)
-            elif hasattr(ctx_or_channel, 'followup'):
-                return await ctx_or_channel.followup.send(embed=embed, **kwargs)
-            return None
+            return await send(embed=embed, **kwargs)
         except:
             return None
 
@@ -1,8 +1,10 @@
+import io
 import logging
 import traceback
 import discord
 from discord.ext import commands
 import config
+from utils.error_handlers import get_error_handler
 
 logger = logging.getLogger(__name__)
 
@@ -12,52 +14,33 @@ async def on_command_error(ctx, error):
     # Get the original error if it's wrapped in a CommandInvokeError
     error = getattr(error, 'original', error)
     
-    # Skip errors that are already handled locally
-    if hasattr(ctx.command, 'on_error'):
-        return
-    
-    # Skip if command has local error handler
-    if ctx.cog and ctx.cog._get_overridden_method(ctx.cog.cog_command_error) is not None:
+    # Skip errors that are already handled locally by the command or its cog.
+    # This is static once the command is registered, so cache it on the command.
+    command = ctx.command
+    if command is not None:
+        skip_global = getattr(command, '_morefix_skip_global', None)
+        if skip_global is None:
+            skip_global = command._morefix_skip_global = bool(
+                hasattr(command, 'on_error')
+                or (ctx.cog and ctx.cog._get_overridden_method(ctx.cog.cog_command_error) is not None)
+            )
+        if skip_global:
+            return
+    elif ctx.cog and ctx.cog._get_overridden_method(ctx.cog.cog_command_error) is not None:
         return
     
     # Create a base embed for errors
     embed = discord.Embed(title="Error", color=config.COLORS["ERROR"])
     
-    # Handle specific error types
+    # Ignore command not found errors
     if isinstance(error, commands.CommandNotFound):
-        # Ignore command not found errors
         return
     
-    elif isinstance(error, commands.DisabledCommand):
-        embed.description = f"Command `{ctx.command}` is currently disabled."
-    
-    elif isinstance(error, commands.NoPrivateMessage):
-        embed.description = f"Command `{ctx.command}` cannot be used in private messages."
-    
-    elif isinstance(error, commands.MissingRequiredArgument):
-        embed.description = f"Missing required argument: `{error.param.name}`"
-        embed.add_field(name="Usage", value=f"`{ctx.prefix}{ctx.command.name} {ctx.command.signature}`", inline=False)
-    
-    elif isinstance(error, commands.BadArgument):
-        embed.description = f"Invalid argument: {str(error)}"
-    
-    elif isinstance(error, commands.ArgumentParsingError):
-        embed.description = str(error)
-    
-    elif isinstance(error, commands.CommandOnCooldown):
-        embed.description = f"This command is on cooldown. Try again in {error.retry_after:.1f}s."
-    
-    elif isinstance(error, commands.MissingPermissions):
-        missing = [perm.replace('_', ' ').replace('guild', 'server').title() for perm in error.missing_permissions]
-        embed.description = f"You're missing the following permissions to run this command: {', '.join(missing)}"
-    
-    elif isinstance(error, commands.BotMissingPermissions):
-        missing = [perm.replace('_', ' ').replace('guild', 'server').title() for perm in error.missing_permissions]
-        embed.description = f"I'm missing the following permissions to run this command: {', '.join(missing)}"
-    
-    elif isinstance(error, commands.CheckFailure):
-        embed.description = "You do not have permission to use this command."
-    
+    # Handle known error types through the shared dispatch table
+    handler = get_error_handler(error, embed=True)
+    if handler is not None:
+        message, embed = handler(ctx, error, embed)
+        embed.description = message
     else:
         # For all other errors, log them and send a generic message
         logger.error(f"Command error in {ctx.command}:", exc_info=error)
@@ -65,7 +48,13 @@ async def on_command_error(ctx, error):
         # More detailed error for admins, generic for regular users
         if ctx.author.id in config.ADMIN_IDS:
             embed.description = f"An error occurred: `{str(error)}`"
-            error_traceback = ''.join(traceback.format_exception(type(error), error, error.__traceback__))
+            # Stream the traceback into a bounded buffer instead of joining every line
+            buffer = io.StringIO()
+            for chunk in traceback.TracebackException(type(error), error, error.__traceback__).format():
+                buffer.write(chunk)
+                if buffer.tell() > 1000:
+                    break
+            error_traceback = buffer.getvalue()
             
             # Split traceback if it's too long
             if len(error_traceback) > 1000:
@@ -12,7 +12,7 @@ from typing import Any, Dict, Optional, Union, Tuple, List, Callable
 import discord
 from discord.ext import commands
 
-from utils.discord_compat import get_command_name, format_command_signature, is_guild_only
+from utils.discord_compat import get_command_name, get_command_signature
 
 logger = logging.getLogger(__name__)
 
@@ -101,6 +101,164 @@ def get_error_data(error: Exception) -> Dict[str, Any]:
     
     return data
 
+# Prebuilt user-facing message templates for the dispatch handlers below.
+# The prefix-command listener (embed replies) and handle_command_error (plain
+# replies) have always used their own wording, so each keeps its own set.
+_COOLDOWN_MSG = "This command is on cooldown. Please try again in {s} seconds."
+_MISSING_PERMS_MSG = "You need the following permissions to use this command: {p}"
+_BOT_MISSING_PERMS_MSG = "I need the following permissions to execute this command: {p}"
+_MISSING_ARG_USAGE_MSG = "Missing required argument: `{p}`.\nUsage: `{prefix}{name} {signature}`"
+_BAD_ARG_MSG = "Invalid argument: {e}"
+_GUILD_ONLY_MSG = "This command can only be used in a server, not in DMs."
+
+_EMBED_COOLDOWN_MSG = "This command is on cooldown. Try again in {s:.1f}s."
+_EMBED_MISSING_PERMS_MSG = "You're missing the following permissions to run this command: {p}"
+_EMBED_BOT_MISSING_PERMS_MSG = "I'm missing the following permissions to run this command: {p}"
+_EMBED_MISSING_ARG_MSG = "Missing required argument: `{p}`"
+_EMBED_USAGE_MSG = "`{prefix}{name} {signature}`"
+_EMBED_DISABLED_MSG = "Command `{c}` is currently disabled."
+_EMBED_NO_PRIVATE_MSG = "Command `{c}` cannot be used in private messages."
+_CHECK_FAILURE_MSG = "You do not have permission to use this command."
+
+def _command_of(source: Any) -> Any:
+    """Return the command attached to a context or interaction, if any"""
+    return getattr(source, "command", None)
+
+def _readable_perms(perms: List[str]) -> str:
+    """Turn permission flags like manage_guild into 'Manage Server'"""
+    return ", ".join(perm.replace('_', ' ').replace('guild', 'server').title() for perm in perms)
+
+def _usage_parts(source: Any) -> Dict[str, str]:
+    """Collect the prefix, name and signature used in usage lines"""
+    command = _command_of(source)
+    return {
+        "prefix": getattr(source, "prefix", "/"),
+        "name": get_command_name(command) if command is not None else "",
+        "signature": get_command_signature(command) if command is not None else "",
+    }
+
+# Result of a dispatch handler: (message, embed), or None when the handler
+# declines the error so it is logged and propagated instead
+_HandlerResult = Optional[Tuple[Optional[str], Optional[discord.Embed]]]
+ErrorHandler = Callable[[Any, Exception, Optional[discord.Embed]], _HandlerResult]
+
+# Plain-text handlers used by handle_command_error
+def _handle_cooldown(source: Any, error: Exception, embed: Optional[discord.Embed]) -> _HandlerResult:
+    return _COOLDOWN_MSG.format(s=round(error.retry_after)), embed
+
+def _handle_missing_permissions(source: Any, error: Exception, embed: Optional[discord.Embed]) -> _HandlerResult:
+    perms = ", ".join(f"`{p}`" for p in getattr(error, "missing_permissions", ["unknown"]))
+    return _MISSING_PERMS_MSG.format(p=perms), embed
+
+def _handle_bot_missing_permissions(source: Any, error: Exception, embed: Optional[discord.Embed]) -> _HandlerResult:
+    perms = ", ".join(f"`{p}`" for p in error.missing_permissions)
+    return _BOT_MISSING_PERMS_MSG.format(p=perms), embed
+
+def _handle_missing_argument(source: Any, error: Exception, embed: Optional[discord.Embed]) -> _HandlerResult:
+    return _MISSING_ARG_USAGE_MSG.format(p=error.param.name, **_usage_parts(source)), embed
+
+def _handle_bad_argument(source: Any, error: Exception, embed: Optional[discord.Embed]) -> _HandlerResult:
+    return _BAD_ARG_MSG.format(e=error), embed
+
+def _handle_check_failure(source: Any, error: Exception, embed: Optional[discord.Embed]) -> _HandlerResult:
+    command = _command_of(source)
+    if (
+        isinstance(error, commands.NoPrivateMessage)
+        or getattr(error, "resource", None) == "guild"
+        or (isinstance(source, commands.Context) and command and getattr(command, "guild_only", False))
+    ):
+        return _GUILD_ONLY_MSG, embed
+    # Other check failures are left to the caller
+    return None
+
+# Embed handlers used by the prefix-command listener (utils.error_handler)
+def _embed_cooldown(source: Any, error: Exception, embed: Optional[discord.Embed]) -> _HandlerResult:
+    return _EMBED_COOLDOWN_MSG.format(s=error.retry_after), embed
+
+def _embed_missing_permissions(source: Any, error: Exception, embed: Optional[discord.Embed]) -> _HandlerResult:
+    return _EMBED_MISSING_PERMS_MSG.format(p=_readable_perms(error.missing_permissions)), embed
+
+def _embed_bot_missing_permissions(source: Any, error: Exception, embed: Optional[discord.Embed]) -> _HandlerResult:
+    return _EMBED_BOT_MISSING_PERMS_MSG.format(p=_readable_perms(error.missing_permissions)), embed
+
+def _embed_missing_argument(source: Any, error: Exception, embed: Optional[discord.Embed]) -> _HandlerResult:
+    if embed is not None:
+        embed.add_field(name="Usage", value=_EMBED_USAGE_MSG.format(**_usage_parts(source)), inline=False)
+    return _EMBED_MISSING_ARG_MSG.format(p=error.param.name), embed
+
+def _embed_argument_parsing(source: Any, error: Exception, embed: Optional[discord.Embed]) -> _HandlerResult:
+    return str(error), embed
+
+def _embed_disabled(source: Any, error: Exception, embed: Optional[discord.Embed]) -> _HandlerResult:
+    return _EMBED_DISABLED_MSG.format(c=_command_of(source)), embed
+
+def _embed_no_private_message(source: Any, error: Exception, embed: Optional[discord.Embed]) -> _HandlerResult:
+    return _EMBED_NO_PRIVATE_MSG.format(c=_command_of(source)), embed
+
+def _embed_check_failure(source: Any, error: Exception, embed: Optional[discord.Embed]) -> _HandlerResult:
+    return _CHECK_FAILURE_MSG, embed
+
+# Dispatch tables for the error taxonomy. Handlers are agnostic of ctx vs
+# interaction and return a _HandlerResult.
+_HANDLERS: Dict[type, ErrorHandler] = {
+    commands.CommandOnCooldown: _handle_cooldown,
+    commands.MissingPermissions: _handle_missing_permissions,
+    commands.BotMissingPermissions: _handle_bot_missing_permissions,
+    commands.MissingRequiredArgument: _handle_missing_argument,
+    commands.BadArgument: _handle_bad_argument,
+    commands.CheckFailure: _handle_check_failure,
+}
+
+_EMBED_HANDLERS: Dict[type, ErrorHandler] = {
+    commands.DisabledCommand: _embed_disabled,
+    commands.NoPrivateMessage: _embed_no_private_message,
+    commands.MissingRequiredArgument: _embed_missing_argument,
+    commands.BadArgument: _handle_bad_argument,
+    commands.ArgumentParsingError: _embed_argument_parsing,
+    commands.CommandOnCooldown: _embed_cooldown,
+    commands.MissingPermissions: _embed_missing_permissions,
+    commands.BotMissingPermissions: _embed_bot_missing_permissions,
+    commands.CheckFailure: _embed_check_failure,
+}
+
+try:
+    from discord import app_commands as _app_commands
+    _HANDLERS[_app_commands.MissingPermissions] = _handle_missing_permissions
+    _HANDLERS[_app_commands.CheckFailure] = _handle_check_failure
+    if hasattr(_app_commands, "CommandOnCooldown"):
+        _HANDLERS[_app_commands.CommandOnCooldown] = _handle_cooldown
+except (ImportError, AttributeError):
+    pass
+
+# Resolved handler per concrete error type (walks the MRO once per type)
+_HANDLER_CACHE: Dict[type, Optional[ErrorHandler]] = {}
+_EMBED_HANDLER_CACHE: Dict[type, Optional[ErrorHandler]] = {}
+
+def get_error_handler(error: Exception, embed: bool = False) -> Optional[ErrorHandler]:
+    """Look up the user-facing message handler for an error
+    
+    Args:
+        error: The exception that was raised
+        embed: Whether to use the embed-reply handlers of the prefix-command listener
+        
+    Returns:
+        The most specific registered handler, or None if the error is unhandled
+    """
+    handlers, cache = (_EMBED_HANDLERS, _EMBED_HANDLER_CACHE) if embed else (_HANDLERS, _HANDLER_CACHE)
+    error_type = type(error)
+    try:
+        return cache[error_type]
+    except KeyError:
+        pass
+    
+    handler = None
+    for klass in error_type.__mro__:
+        handler = handlers.get(klass)
+        if handler is not None:
+            break
+    cache[error_type] = handler
+    return handler
+
 async def handle_command_error(
     ctx_or_interaction: Union[commands.Context, discord.Interaction],
     error: Exception,
@@ -126,6 +284,8 @@ async def handle_command_error(
     channel_name = "Unknown channel"
     user_name = "Unknown user"
     
+    handler = get_error_handler(error)
+    
     # Extract command and context information based on context type
     if isinstance(ctx_or_interaction, commands.Context):
         ctx = ctx_or_interaction
@@ -134,46 +294,10 @@ async def handle_command_error(
         channel_name = getattr(ctx.channel, "name", "Unknown")
         user_name = str(ctx.author)
         
-        # Handle cooldown errors
-        if isinstance(error, commands.CommandOnCooldown):
-            seconds = round(error.retry_after)
-            message = f"This command is on cooldown. Please try again in {seconds} seconds."
-            await ctx.send(message, ephemeral=ephemeral)
-            return True
-            
-        # Handle permission errors
-        elif isinstance(error, commands.MissingPermissions):
-            perms = ", ".join(f"`{p}`" for p in error.missing_permissions)
-            message = f"You need the following permissions to use this command: {perms}"
-            await ctx.send(message, ephemeral=ephemeral)
-            return True
-            
-        # Handle bot permission errors
-        elif isinstance(error, commands.BotMissingPermissions):
-            perms = ", ".join(f"`{p}`" for p in error.missing_permissions)
-            message = f"I need the following permissions to execute this command: {perms}"
-            await ctx.send(message, ephemeral=ephemeral)
-            return True
-            
-        # Handle missing arguments
-        elif isinstance(error, commands.MissingRequiredArgument):
-            message = f"Missing required argument: `{error.param.name}`."
-            usage = f"Usage: `{ctx.prefix}{format_command_signature(ctx.command)}`"
-            await ctx.send(f"{message}\n{usage}", ephemeral=ephemeral)
-            return True
-            
-        # Handle check failures like guild_only
-        elif isinstance(error, commands.NoPrivateMessage) or (
-            isinstance(error, commands.CheckFailure) and 
-            ctx.command and is_guild_only(ctx.command)
-        ):
-            await ctx.send("This command can only be used in a server, not in DMs.", ephemeral=ephemeral)
-            return True
-            
-        # Handle bad arguments
-        elif isinstance(error, commands.BadArgument):
-            message = f"Invalid argument: {str(error)}"
-            await ctx.send(message, ephemeral=ephemeral)
+        result = handler(ctx, error, None) if handler is not None else None
+        if result is not None:
+            message, embed = result
+            await ctx.send(message, embed=embed, ephemeral=ephemeral)
             return True
         
     # Handle interaction-based errors (application commands)
@@ -184,31 +308,15 @@ async def handle_command_error(
         channel_name = getattr(interaction.channel, "name", "Unknown") if interaction.channel else "Unknown"
         user_name = str(interaction.user)
         
-        # Check if the response has already been sent
-        try:
-            # Special handling for missing permissions in app commands
-            if isinstance(error, discord.app_commands.errors.MissingPermissions):
-                perms = ", ".join(f"`{p}`" for p in getattr(error, "missing_permissions", ["unknown"]))
-                message = f"You need the following permissions to use this command: {perms}"
-                await interaction.response.send_message(message, ephemeral=ephemeral)
-                return True
-                
-            # Handle check failures such as guild_only
-            elif isinstance(error, discord.app_commands.errors.CheckFailure):
-                resource = getattr(error, "resource", None)
-                if resource == "guild":
-                    await interaction.response.send_message("This command can only be used in a server, not in DMs.", ephemeral=ephemeral)
-                    return True
-                    
-            # Handle cooldowns
-            elif hasattr(discord.app_commands, "errors") and hasattr(discord.app_commands.errors, "CommandOnCooldown") and isinstance(error, discord.app_commands.errors.CommandOnCooldown):
-                seconds = round(error.retry_after)
-                message = f"This command is on cooldown. Please try again in {seconds} seconds."
-                await interaction.response.send_message(message, ephemeral=ephemeral)
+        result = handler(interaction, error, None) if handler is not None else None
+        if result is not None:
+            message, embed = result
+            try:
+                await interaction.response.send_message(message, embed=embed, ephemeral=ephemeral)
                 return True
-        except discord.InteractionResponded:
-            # Interaction has already been responded to
-            pass
+            except discord.InteractionResponded:
+                # Interaction has already been responded to
+                pass
             
     # Log the error with context information
     error_type = type(error).__name__
@@ -221,4 +329,4 @@ async def handle_command_error(
         logger.error("".join(error_data["traceback"]))
     
     # Return False for unhandled errors, allowing them to propagate
-    return False
\ No newline at end of file
+    return False
@@ -16,34 +16,22 @@ import traceback
 import asyncio
 import re
 import json
+import queue
 import datetime
-import uuid
+import itertools
 import hashlib
+import secrets
 from typing import Dict, List, Any, Optional, Union, Set, Tuple, Callable
-from collections import defaultdict, Counter
+from collections import defaultdict, Counter, deque
 from datetime import datetime, timedelta
 import inspect
 import functools
 
+from pymongo import UpdateOne
+
 # Configure module-specific logger
 logger = logging.getLogger(__name__)
 
-# Initialize global state
-_error_telemetry_enabled = True
-_telemetry_initialized = False
-_error_categories = set()
-_category_patterns = {}
-_db = None  # Will be set during initialization
-_background_task = None
-_error_buffer = []
-_buffer_lock = asyncio.Lock()
-_stats = {
-    "errors_tracked": 0,
-    "errors_aggregated": 0,
-    "flush_count": 0,
-    "last_flush": None
-}
-
 # Constants
 MAX_BUFFER_SIZE = 100
 FLUSH_INTERVAL = 60  # seconds
@@ -51,6 +39,72 @@ MAX_CONTEXT_SIZE = 10240  # bytes
 MAX_ERROR_HISTORY = 1000  # per category
 ERROR_RECORD_TTL = 30  # days to keep error records
 
+class _State:
+    """Module-level telemetry state packed into slots for fast attribute access"""
+    
+    __slots__ = (
+        "enabled", "initialized", "db", "background_task", "category_patterns",
+        "buffer", "buffer_lock", "buffer_lock_loop", "record_counter", "formatted_fingerprints",
+        "skip_type_cache", "sync_error_queue", "stats"
+    )
+    
+    def __init__(self):
+        self.enabled = True
+        self.initialized = False
+        self.db = None  # Will be set during initialization
+        self.background_task = None
+        self.category_patterns = []  # (category, keywords, compiled alternation) in priority order
+        self.buffer = deque(maxlen=MAX_BUFFER_SIZE * 2)  # Bounded; oldest records are evicted first
+        self.buffer_lock = None  # Created lazily by _get_buffer_lock
+        self.buffer_lock_loop = None  # Event loop the buffer lock belongs to
+        self.record_counter = itertools.count()  # Makes record IDs unique within the process
+        self.formatted_fingerprints = set()  # Fingerprints whose traceback is already in the buffer
+        self.skip_type_cache = {}  # Context value type -> whether the sanitizer skips it
+        self.sync_error_queue = queue.Queue(maxsize=MAX_BUFFER_SIZE * 2)  # Errors from sync wrappers, any thread
+        self.stats = {
+            "errors_tracked": 0,
+            "errors_aggregated": 0,
+            "flush_count": 0,
+            "last_flush": None
+        }
+
+# Initialize global state
+_state = _State()
+
+# Random 32-bit per-process prefix for record IDs, so IDs from other processes,
+# shards or restarts writing to the same collection do not collide
+_RECORD_ID_PREFIX = secrets.token_hex(4)
+
+def _get_buffer_lock():
+    """Return the buffer lock for the running event loop, creating it on first use
+    
+    Creating the lock lazily avoids binding it at import time, and a new lock
+    is made if the module is used from a different loop (e.g. one per test).
+    """
+    loop = asyncio.get_running_loop()
+    if _state.buffer_lock_loop is not loop:
+        _state.buffer_lock = asyncio.Lock()
+        _state.buffer_lock_loop = loop
+    return _state.buffer_lock
+
+# Precompiled patterns used to normalize variable data out of error messages.
+# IDs, dates, times and IPs are always ASCII digits, so they match [0-9]
+# rather than the Unicode \d class.
+_RE_ID = re.compile(r'\b[0-9]{6,}\b')
+_RE_DATE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+
+# Single-pass normalization: each named group maps to a <GROUP> placeholder.
+# Alternatives are ordered so URLs win over paths and IPs over bare numbers.
+# URLs and paths stay Unicode-aware so non-ASCII path segments are kept whole.
+_RE_NORM = re.compile(
+    r'(?P<URL>https?://\S+)'
+    r'|(?P<PATH>(?:/[\w.]+)+/?)'
+    r'|(?P<IP>[0-9]{1,3}(?:\.[0-9]{1,3}){3})'
+    r'|(?P<DATE>[0-9]{4}-[0-9]{2}-[0-9]{2})'
+    r'|(?P<TIME>[0-9]{2}:[0-9]{2}:[0-9]{2})'
+    r'|(?P<ID>\b[0-9]{6,}\b)'
+)
+
 # Define standard error categories
 STANDARD_CATEGORIES = {
     "discord_api": [
@@ -107,6 +161,27 @@ STANDARD_CATEGORIES = {
     ]
 }
 
+def _compile_category_patterns(patterns):
+    """Compile a list of category patterns into a single case-insensitive alternation"""
+    return re.compile(
+        "|".join(f"(?:{pattern.replace('(?i)', '')})" for pattern in patterns),
+        re.IGNORECASE
+    )
+
+# Literal substrings that every pattern of a category requires (lowercase).
+# categorize_error only runs a category's regex when one of them is present.
+CATEGORY_KEYWORDS = {
+    "discord_api": ("discord", "interaction", "webhook"),
+    "database": ("mongo", "database", "connection"),
+    "sftp": ("sftp",),
+    "permission": ("permission", "authorized"),
+    "validation": ("invalid", "validation"),
+    "file_system": ("file", "directory", "permission"),
+    "timeout": ("timeout", "timed", "took"),
+    "rate_limit": ("rate", "many", "slow"),
+    "api_error": ("api", "request", "status")
+}
+
 # Error Context Extractor Functions
 def extract_discord_context(error, context):
     """Extract Discord-specific information for context"""
@@ -178,7 +253,72 @@ CONTEXT_EXTRACTORS = {
 }
 
 # Error fingerprinting functions
-def get_error_fingerprint(error, error_type=None, error_message=None):
+def extract_error_frames(error):
+    """Extract the traceback frames of an error without loading source lines
+    
+    Args:
+        error: The exception object
+    
+    Returns:
+        A list of FrameSummary objects (empty if the error has no traceback)
+    """
+    tb = getattr(error, '__traceback__', None)
+    if tb is None:
+        return []
+    return traceback.StackSummary.extract(traceback.walk_tb(tb), lookup_lines=False)
+
+# Separators between chained exceptions, as printed by the traceback module
+_CAUSE_SEPARATOR = "\n\nThe above exception was the direct cause of the following exception:\n\n"
+_CONTEXT_SEPARATOR = "\n\nDuring handling of the above exception, another exception occurred:\n\n"
+
+def _format_frame_section(tb_list, error_type, error_message):
+    """Format one exception's frames and its "Type: message" line"""
+    lines = ["Traceback (most recent call last):\n"]
+    for frame in tb_list:
+        lines.append(f'  File "{frame.filename}", line {frame.lineno}, in {frame.name}\n')
+    lines.append(f"{error_type}: {error_message}")
+    return ''.join(lines)
+
+def format_error_frames(tb_list, error_type, error_message, error=None):
+    """Format extracted frames into a traceback string without source lines
+    
+    Args:
+        tb_list: Frames returned by extract_error_frames
+        error_type: The error type name
+        error_message: The error message
+        error: Optional exception whose __cause__/__context__ chain is
+            formatted before it, like traceback.format_exception does
+    
+    Returns:
+        A traceback string
+    """
+    # Collect sections from the outermost exception inwards, then reverse so
+    # the innermost exception comes first
+    sections = [_format_frame_section(tb_list, error_type, error_message)]
+    seen = {id(error)}
+    current = error
+    while current is not None:
+        if current.__cause__ is not None:
+            linked, separator = current.__cause__, _CAUSE_SEPARATOR
+        elif current.__context__ is not None and not current.__suppress_context__:
+            linked, separator = current.__context__, _CONTEXT_SEPARATOR
+        else:
+            break
+        
+        # Guard against reference cycles in the chain
+        if id(linked) in seen:
+            break
+        seen.add(id(linked))
+        
+        sections.append(separator)
+        sections.append(_format_frame_section(
+            extract_error_frames(linked), type(linked).__name__, str(linked)
+        ))
+        current = linked
+    
+    return ''.join(reversed(sections))
+
+def get_error_fingerprint(error, error_type=None, error_message=None, tb_list=None):
     """Generate a unique fingerprint for an error
     
     This creates a hash that can be used to identify similar errors.
@@ -187,6 +327,7 @@ def get_error_fingerprint(error, error_type=None, error_message=None):
         error: The exception object
         error_type: Optional explicit error type
         error_message: Optional explicit error message
+        tb_list: Optional frames already extracted with extract_error_frames
     
     Returns:
         A string hash that identifies this error pattern
@@ -199,7 +340,7 @@ def get_error_fingerprint(error, error_type=None, error_message=None):
         error_message = str(error)
     
     # Get the traceback info
-    tb = traceback.extract_tb(error.__traceback__) if hasattr(error, '__traceback__') and error.__traceback__ else []
+    tb = tb_list if tb_list is not None else extract_error_frames(error)
     
     # Create a simplified traceback representation for fingerprinting
     # We only include filenames and line numbers, not the full paths
@@ -215,15 +356,25 @@ def get_error_fingerprint(error, error_type=None, error_message=None):
     else:
         # If no traceback, just use the error type and a normalized message
         # Normalize the message by removing specific values like IDs, timestamps
-        normalized_message = re.sub(r'\b\d{6,}\b', 'ID', error_message)  # Replace numeric IDs
-        normalized_message = re.sub(r'\d{4}-\d{2}-\d{2}', 'DATE', normalized_message)  # Replace dates
+        normalized_message = _RE_ID.sub('ID', error_message)  # Replace numeric IDs
+        normalized_message = _RE_DATE.sub('DATE', normalized_message)  # Replace dates
         fingerprint_base = f"{error_type}:{normalized_message[:100]}"
     
     # Create a stable hash for the fingerprint
-    fingerprint = hashlib.md5(fingerprint_base.encode()).hexdigest()
+    fingerprint = hashlib.blake2b(fingerprint_base.encode(), digest_size=16).hexdigest()
     
     return fingerprint
 
+def _normalization_placeholder(match):
+    """Replacement callback for _RE_NORM"""
+    return f"<{match.lastgroup}>"
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_truncated_message(error_message):
+    """Cached normalization of an already truncated error message"""
+    # Replace IDs, dates, times, paths, URLs and IPs in one pass
+    return _RE_NORM.sub(_normalization_placeholder, error_message)
+
 def normalize_error_message(error_message):
     """Normalize an error message by removing variable data
     
@@ -236,28 +387,8 @@ def normalize_error_message(error_message):
     if not error_message:
         return "Unknown error"
     
-    # Limit length
-    error_message = error_message[:200]
-    
-    # Replace specific IDs with placeholders
-    normalized = re.sub(r'\b\d{6,}\b', '<ID>', error_message)
-    
-    # Replace dates
-    normalized = re.sub(r'\d{4}-\d{2}-\d{2}', '<DATE>', normalized)
-    
-    # Replace times
-    normalized = re.sub(r'\d{2}:\d{2}:\d{2}', '<TIME>', normalized)
-    
-    # Replace file paths
-    normalized = re.sub(r'(\/[\w\.]+)+\/?', '<PATH>', normalized)
-    
-    # Replace URLs
-    normalized = re.sub(r'https?:\/\/[^\s]+', '<URL>', normalized)
-    
-    # Replace IP addresses
-    normalized = re.sub(r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}', '<IP>', normalized)
-    
-    return normalized
+    # Limit length before the cache lookup so cache keys stay bounded
+    return _normalize_truncated_message(error_message[:200])
 
 def categorize_error(error, context=None):
     """Determine the category of an error
@@ -269,8 +400,6 @@ def categorize_error(error, context=None):
     Returns:
         The error category string
     """
-    global _category_patterns
-    
     # Get the error message
     if isinstance(error, Exception):
         error_type = type(error).__name__
@@ -286,15 +415,130 @@ def categorize_error(error, context=None):
     if context and 'category' in context:
         return context['category']
     
-    # Try to match against patterns
-    for category, patterns in _category_patterns.items():
-        for pattern in patterns:
-            if re.search(pattern, error_string):
-                return category
+    # Try to match against the precompiled per-category alternations, skipping
+    # categories whose required keywords are absent from the message
+    lowered = error_string.lower()
+    for category, keywords, pattern in _state.category_patterns:
+        if keywords and not any(keyword in lowered for keyword in keywords):
+            continue
+        if pattern.search(error_string):
+            return category
     
     # Default to uncategorized
     return "uncategorized"
 
+def _is_unserializable(value):
+    """Whether a context value should be skipped (callables, classes, modules)
+    
+    The decision only depends on the value's type, so it is cached per type.
+    """
+    value_type = type(value)
+    skip = _state.skip_type_cache.get(value_type)
+    if skip is None:
+        skip = _state.skip_type_cache[value_type] = (
+            callable(value) or inspect.isclass(value) or inspect.ismodule(value)
+        )
+    return skip
+
+def _serialize_context(context_items):
+    """Convert context items to a size-limited dictionary of strings
+    
+    Args:
+        context_items: Iterable of (key, value) pairs
+    
+    Returns:
+        Dictionary safe to store in the database
+    """
+    safe_context = {}
+    context_size = 0
+    for k, v in context_items:
+        try:
+            # Skip complex objects that can't be easily serialized
+            if _is_unserializable(v):
+                continue
+                
+            # Convert to string and limit size
+            v_str = str(v)
+            if len(v_str) > 1000:
+                v_str = v_str[:1000] + "..."
+                
+            safe_context[k] = v_str
+            context_size += len(k) + len(v_str)
+            
+            # Stop if context gets too large
+            if context_size > MAX_CONTEXT_SIZE:
+                safe_context["_truncated"] = True
+                break
+        except Exception:
+            continue
+    
+    return safe_context
+
+def _build_bulk_ops(buffer_copy):
+    """Aggregate buffered error records into one upsert per fingerprint
+    
+    Args:
+        buffer_copy: List of error records taken from the buffer
+    
+    Returns:
+        List of UpdateOne operations for bulk_write
+    """
+    # Aggregate errors by fingerprint in a single pass: occurrence counts,
+    # the first record as reference, the first formatted traceback (later
+    # duplicates are stored without one) and the occurrence entries to push
+    counts = Counter()
+    references = {}
+    tracebacks = {}
+    occurrences = defaultdict(list)
+    for error in buffer_copy:
+        fingerprint = error["fingerprint"]
+        counts[fingerprint] += 1
+        references.setdefault(fingerprint, error)
+        if error["traceback"] and fingerprint not in tracebacks:
+            tracebacks[fingerprint] = error["traceback"]
+        occurrences[fingerprint].append({
+            "timestamp": error["timestamp"],
+            "error_id": error["id"],
+            "context": error["context"]
+        })
+    
+    # Build one upsert per fingerprint: $setOnInsert fills the immutable
+    # fields of new records, so no existence probe is needed and the
+    # unique fingerprint index keeps concurrent flushes race-free
+    operations = []
+    for fingerprint, count in counts.items():
+        reference_error = references[fingerprint]
+        update = {
+            "$setOnInsert": {
+                "category": reference_error["category"],
+                "error_type": reference_error["error_type"],
+                "first_seen": reference_error["timestamp"],
+                "error_message": reference_error["error_message"],
+                "normalized_message": reference_error["normalized_message"]
+            },
+            "$set": {
+                "last_seen": reference_error["timestamp"],
+                "last_error_id": reference_error["id"],
+                "last_message": reference_error["error_message"],
+                "last_context": reference_error["context"]
+            },
+            "$inc": {"occurrence_count": count},
+            "$push": {
+                "recent_occurrences": {
+                    "$each": occurrences[fingerprint],
+                    "$slice": -MAX_ERROR_HISTORY
+                }
+            }
+        }
+        # Keep the stored traceback if the record carrying it was evicted
+        # or dropped before this flush
+        if fingerprint in tracebacks:
+            update["$set"]["last_traceback"] = tracebacks[fingerprint]
+        
+        operations.append(UpdateOne({"fingerprint": fingerprint}, update, upsert=True))
+    
+    return operations
+
 class ErrorTelemetry:
     """Error telemetry manager for tracking and analyzing errors"""
     
@@ -304,22 +548,25 @@ class ErrorTelemetry:
         Args:
             db: Database instance for storing error data
         """
-        global _db, _telemetry_initialized, _category_patterns
-        
-        if _telemetry_initialized:
+        if _state.initialized:
             logger.debug("Error telemetry already initialized")
             return
         
         logger.info("Initializing error telemetry")
         
         # Store database reference
-        _db = db
+        _state.db = db
         
-        # Initialize category patterns
-        _category_patterns = STANDARD_CATEGORIES.copy()
+        # Fuse each category's patterns into one compiled alternation so every
+        # category costs a single search; "uncategorized" is the fallback result
+        _state.category_patterns = [
+            (category, CATEGORY_KEYWORDS.get(category), _compile_category_patterns(patterns))
+            for category, patterns in STANDARD_CATEGORIES.items()
+            if category != "uncategorized"
+        ]
         
         # Mark as initialized
-        _telemetry_initialized = True
+        _state.initialized = True
     
     @classmethod
     async def get_error_id(cls, error):
@@ -336,7 +583,7 @@ class ErrorTelemetry:
             return get_error_fingerprint(error)
         
         # For non-exception errors, generate a simple hash
-        return hashlib.md5(str(error).encode()).hexdigest()
+        return hashlib.blake2b(str(error).encode(), digest_size=16).hexdigest()
     
     @staticmethod
     async def track_error(error, context=None, category=None, flush=False):
@@ -351,9 +598,17 @@ class ErrorTelemetry:
         Returns:
             Error record ID
         """
-        global _error_buffer, _stats
+        # Record errors queued from synchronous code first so they are not
+        # held back until the next maintenance pass
+        if not _state.sync_error_queue.empty():
+            await ErrorTelemetry.drain_sync_errors()
         
-        if not _error_telemetry_enabled:
+        return await ErrorTelemetry._track_error(error, context, category, flush)
+    
+    @staticmethod
+    async def _track_error(error, context=None, category=None, flush=False):
+        """Record a single error in the buffer (see track_error)"""
+        if not _state.enabled:
             return None
         
         # Ensure context is a dictionary
@@ -363,24 +618,34 @@ class ErrorTelemetry:
         # Determine error details
         if isinstance(error, Exception):
             error_type = type(error).__name__
-            error_message = str(error)
-            error_traceback = traceback.format_exception(type(error), error, error.__traceback__)
-            error_traceback_str = ''.join(error_traceback)
         else:
             error_type = "Unknown"
-            error_message = str(error)
-            error_traceback_str = ''.join(traceback.format_stack())
+        error_message = str(error)
         
         # Determine category
         if category is None:
             category = categorize_error(error, context)
         
+        # Walk the traceback once and reuse it for the fingerprint and storage
+        tb_list = extract_error_frames(error) if isinstance(error, Exception) else None
+        
         # Generate fingerprint
-        fingerprint = get_error_fingerprint(error, error_type, error_message)
+        fingerprint = get_error_fingerprint(error, error_type, error_message, tb_list=tb_list)
+        
+        # Only format the traceback for the first occurrence of a fingerprint in
+        # the current buffer; duplicates share the reference record's traceback
+        if fingerprint in _state.formatted_fingerprints:
+            error_traceback_str = ''
+        else:
+            _state.formatted_fingerprints.add(fingerprint)
+            if tb_list is not None:
+                error_traceback_str = format_error_frames(tb_list, error_type, error_message, error)
+            else:
+                error_traceback_str = ''.join(traceback.format_stack())
         
         # Create error record
         timestamp = datetime.utcnow()
-        record_id = str(uuid.uuid4())
+        record_id = f"{_RECORD_ID_PREFIX}-{int(timestamp.timestamp() * 1000):x}-{next(_state.record_counter):x}"
         
         # Extract additional context based on category
         extracted_context = {}
@@ -390,32 +655,15 @@ class ErrorTelemetry:
             except Exception as e:
                 logger.warning(f"Failed to extract context for {category}: {e}")
         
-        # Merge contexts, with explicit context taking precedence
-        merged_context = {**extracted_context, **context}
+        # Walk both contexts without building a merged dict; explicit context
+        # takes precedence, so extracted keys it overrides are skipped
+        context_items = itertools.chain(
+            ((k, v) for k, v in extracted_context.items() if k not in context),
+            context.items()
+        )
         
         # Ensure context is serializable and limit size
-        safe_context = {}
-        context_size = 0
-        for k, v in merged_context.items():
-            try:
-                # Skip complex objects that can't be easily serialized
-                if callable(v) or inspect.isclass(v) or inspect.ismodule(v):
-                    continue
-                    
-                # Convert to string and limit size
-                v_str = str(v)
-                if len(v_str) > 1000:
-                    v_str = v_str[:1000] + "..."
-                    
-                safe_context[k] = v_str
-                context_size += len(k) + len(v_str)
-                
-                # Stop if context gets too large
-                if context_size > MAX_CONTEXT_SIZE:
-                    safe_context["_truncated"] = True
-                    break
-            except Exception:
-                continue
+        safe_context = _serialize_context(context_items)
         
         # Create the error record
         error_record = {
@@ -431,31 +679,44 @@ class ErrorTelemetry:
         }
         
         # Add to buffer
-        async with _buffer_lock:
-            _error_buffer.append(error_record)
-            _stats["errors_tracked"] += 1
-            
-            # Flush if buffer is full or explicitly requested
-            if flush or len(_error_buffer) >= MAX_BUFFER_SIZE:
-                await ErrorTelemetry.flush_error_buffer()
+        async with _get_buffer_lock():
+            buffer = _state.buffer
+            if len(buffer) == buffer.maxlen and buffer[0]["traceback"]:
+                # The append evicts the record carrying this fingerprint's
+                # traceback, so let the next occurrence format it again
+                _state.formatted_fingerprints.discard(buffer[0]["fingerprint"])
+            buffer.append(error_record)
+            _state.stats["errors_tracked"] += 1
+            should_flush = flush or len(_state.buffer) >= MAX_BUFFER_SIZE
+        
+        # Flush if buffer is full or explicitly requested (outside the lock,
+        # since flush_error_buffer acquires it itself)
+        if should_flush:
+            await ErrorTelemetry.flush_error_buffer()
         
         return record_id
     
     @staticmethod
     async def flush_error_buffer():
         """Flush the error buffer to the database"""
-        global _error_buffer, _db, _stats
+        if not _state.sync_error_queue.empty():
+            await ErrorTelemetry.drain_sync_errors()
         
-        if _db is None:
+        if _state.db is None:
             logger.warning("Cannot flush error buffer: database not initialized")
             return False
         
-        async with _buffer_lock:
-            if not _error_buffer:
+        # Lock-free peek: a stale read only defers the flush to the next tick
+        if not _state.buffer:
+            return True
+        
+        async with _get_buffer_lock():
+            if not _state.buffer:
                 return True
             
-            buffer_copy = _error_buffer.copy()
-            _error_buffer = []
+            buffer_copy = list(_state.buffer)
+            _state.buffer.clear()
+            _state.formatted_fingerprints.clear()
         
         # Skip further processing if no buffer
         if not buffer_copy:
@@ -463,80 +724,18 @@ class ErrorTelemetry:
         
         try:
             # Try to store errors in the database
-            errors_collection = _db.errors
+            errors_collection = _state.db.errors
             
-            # First aggregate errors by fingerprint
-            errors_by_fingerprint = defaultdict(list)
-            for error in buffer_copy:
-                errors_by_fingerprint[error["fingerprint"]].append(error)
+            # Aggregation and op building is pure CPU work, keep it off the loop
+            operations = await asyncio.to_thread(_build_bulk_ops, buffer_copy)
             
-            # Process each fingerprint
-            for fingerprint, errors in errors_by_fingerprint.items():
-                # Get the first error as a reference
-                reference_error = errors[0]
-                
-                # Check if this fingerprint already exists in the database
-                existing = await errors_collection.find_one({"fingerprint": fingerprint})
-                
-                if existing:
-                    # Update the existing record
-                    update = {
-                        "$inc": {"occurrence_count": len(errors)},
-                        "$set": {
-                            "last_seen": reference_error["timestamp"],
-                            "last_error_id": reference_error["id"],
-                            "last_message": reference_error["error_message"],
-                            "last_traceback": reference_error["traceback"],
-                            "last_context": reference_error["context"]
-                        },
-                        "$push": {
-                            "recent_occurrences": {
-                                "$each": [
-                                    {
-                                        "timestamp": e["timestamp"],
-                                        "error_id": e["id"],
-                                        "context": e["context"]
-                                    } for e in errors
-                                ],
-                                "$slice": -MAX_ERROR_HISTORY
-                            }
-                        }
-                    }
-                    
-                    await errors_collection.update_one(
-                        {"fingerprint": fingerprint},
-                        update
-                    )
-                else:
-                    # Create a new aggregated record
-                    aggregated_record = {
-                        "fingerprint": fingerprint,
-                        "category": reference_error["category"],
-                        "error_type": reference_error["error_type"],
-                        "first_seen": reference_error["timestamp"],
-                        "last_seen": reference_error["timestamp"],
-                        "occurrence_count": len(errors),
-                        "error_message": reference_error["error_message"],
-                        "normalized_message": reference_error["normalized_message"],
-                        "last_error_id": reference_error["id"],
-                        "last_message": reference_error["error_message"],
-                        "last_traceback": reference_error["traceback"],
-                        "last_context": reference_error["context"],
-                        "recent_occurrences": [
-                            {
-                                "timestamp": e["timestamp"],
-                                "error_id": e["id"],
-                                "context": e["context"]
-                            } for e in errors
-                        ]
-                    }
-                    
-                    await errors_collection.insert_one(aggregated_record)
+            # Submit all writes in one round-trip
+            await errors_collection.bulk_write(operations, ordered=False)
             
             # Update stats
-            _stats["errors_aggregated"] += len(buffer_copy)
-            _stats["flush_count"] += 1
-            _stats["last_flush"] = datetime.utcnow()
+            _state.stats["errors_aggregated"] += len(buffer_copy)
+            _state.stats["flush_count"] += 1
+            _state.stats["last_flush"] = datetime.utcnow()
             
             logger.debug(f"Flushed {len(buffer_copy)} errors to database")
             return True
@@ -545,12 +744,16 @@ class ErrorTelemetry:
             logger.error(f"Error flushing telemetry buffer: {e}")
             
             # Re-add errors to buffer if they couldn't be stored
-            async with _buffer_lock:
-                # Only keep up to the maximum size to prevent infinite growth
-                combined = buffer_copy + _error_buffer
-                if len(combined) > MAX_BUFFER_SIZE * 2:
-                    combined = combined[-MAX_BUFFER_SIZE * 2:]
-                _error_buffer = combined
+            async with _get_buffer_lock():
+                # Only re-queue what fits so the oldest records are the ones dropped
+                room = _state.buffer.maxlen - len(_state.buffer)
+                if room > 0:
+                    requeued = buffer_copy[-room:]
+                    _state.buffer.extendleft(reversed(requeued))
+                    # Fingerprints whose traceback is back in the buffer
+                    _state.formatted_fingerprints.update(
+                        error["fingerprint"] for error in requeued if error["traceback"]
+                    )
             
             return False
     
@@ -565,13 +768,13 @@ class ErrorTelemetry:
         Returns:
             Dictionary with error statistics
         """
-        if _db is None:
+        if _state.db is None:
             return {"error": "Database not initialized"}
         
         stats = {}
         
         try:
-            errors_collection = _db.errors
+            errors_collection = _state.db.errors
             
             # Build query
             query = {}
@@ -672,11 +875,11 @@ class ErrorTelemetry:
         Returns:
             Dictionary with error details
         """
-        if _db is None:
+        if _state.db is None:
             return {"error": "Database not initialized"}
         
         try:
-            errors_collection = _db.errors
+            errors_collection = _state.db.errors
             
             # Find the specific error
             error = await errors_collection.find_one({"fingerprint": fingerprint})
@@ -756,12 +959,25 @@ class ErrorTelemetry:
                     if context:
                         func_context.update(context)
                     
-                    # Capture the error (using asyncio.run since track_error is async)
-                    asyncio.create_task(ErrorTelemetry.track_error(
-                        error=e,
-                        context=func_context,
-                        category=category
-                    ))
+                    # Track the error right away when this thread runs an event
+                    # loop; otherwise queue it for the next async track_error,
+                    # flush or maintenance pass, which is safe from any thread
+                    try:
+                        loop = asyncio.get_running_loop()
+                    except RuntimeError:
+                        loop = None
+                    
+                    if loop is not None:
+                        loop.create_task(ErrorTelemetry.track_error(
+                            error=e,
+                            context=func_context,
+                            category=category
+                        ))
+                    else:
+                        try:
+                            _state.sync_error_queue.put_nowait((e, func_context, category))
+                        except queue.Full:
+                            logger.warning(f"Sync error queue full, dropping error from {func.__name__}")
                     
                     # Re-raise the exception
                     raise
@@ -774,21 +990,37 @@ class ErrorTelemetry:
                 
         return decorator
     
+    @staticmethod
+    async def drain_sync_errors():
+        """Track all errors queued by synchronous capture_exceptions wrappers"""
+        while True:
+            try:
+                error, context, category = _state.sync_error_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            await ErrorTelemetry._track_error(
+                error=error,
+                context=context,
+                category=category
+            )
+    
     @staticmethod
     async def start_maintenance_task():
         """Start background maintenance task for error telemetry"""
-        global _background_task
-        
         async def maintenance_loop():
             while True:
                 try:
+                    # Track errors captured in synchronous code
+                    await ErrorTelemetry.drain_sync_errors()
+                    
                     # Flush error buffer
                     await ErrorTelemetry.flush_error_buffer()
                     
                     # Clean up old errors
-                    if _db:
+                    if _state.db:
                         cutoff_date = datetime.utcnow() - timedelta(days=ERROR_RECORD_TTL)
-                        await _db.errors.delete_many({"last_seen": {"$lt": cutoff_date}})
+                        await _state.db.errors.delete_many({"last_seen": {"$lt": cutoff_date}})
                     
                     # Sleep until next run
                     await asyncio.sleep(FLUSH_INTERVAL)
@@ -800,37 +1032,33 @@ class ErrorTelemetry:
                     logger.error(f"Error in telemetry maintenance task: {e}")
                     await asyncio.sleep(FLUSH_INTERVAL)
         
-        if _background_task is None or _background_task.done():
-            _background_task = asyncio.create_task(maintenance_loop())
+        if _state.background_task is None or _state.background_task.done():
+            _state.background_task = asyncio.create_task(maintenance_loop())
             logger.info("Started error telemetry maintenance task")
     
     @staticmethod
     async def stop_maintenance_task():
         """Stop the background maintenance task"""
-        global _background_task
-        
-        if _background_task and not _background_task.done():
-            _background_task.cancel()
+        if _state.background_task and not _state.background_task.done():
+            _state.background_task.cancel()
             try:
-                await _background_task
+                await _state.background_task
             except asyncio.CancelledError:
                 pass
             
-            _background_task = None
+            _state.background_task = None
             logger.info("Stopped error telemetry maintenance task")
     
     @staticmethod
     def enable():
         """Enable error telemetry"""
-        global _error_telemetry_enabled
-        _error_telemetry_enabled = True
+        _state.enabled = True
         logger.info("Error telemetry enabled")
     
     @staticmethod
     def disable():
         """Disable error telemetry"""
-        global _error_telemetry_enabled
-        _error_telemetry_enabled = False
+        _state.enabled = False
         logger.info("Error telemetry disabled")
 
 # Initialize the error telemetry system
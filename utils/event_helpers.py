@@ -9,6 +9,7 @@ import asyncio
 import inspect
 import logging
 import functools
+import sys
 from typing import Any, Callable, Coroutine, Dict, List, Optional, Set, TypeVar, Union, cast
 
 # Setup logger
@@ -38,6 +39,97 @@ T = TypeVar('T')
 EventT = TypeVar('EventT')
 ListenerT = Callable[..., Coroutine[Any, Any, Any]]
 
+# Eager tasks (Python 3.12+) run the coroutine synchronously until its first
+# real suspension instead of waiting a loop iteration before starting
+_EAGER_TASKS = sys.version_info >= (3, 12)
+
+def _spawn(coro: Coroutine[Any, Any, T]) -> "asyncio.Task[T]":
+    """
+    Schedule a coroutine as a task, starting it eagerly when supported.
+    
+    Args:
+        coro: Coroutine to schedule
+        
+    Returns:
+        The created task
+    """
+    if _EAGER_TASKS:
+        return asyncio.Task(coro, loop=asyncio.get_running_loop(), eager_start=True)
+    return asyncio.create_task(coro)
+
+def _resolve_event_name(func: Callable[..., Any], name: Optional[str] = None) -> str:
+    """
+    Resolve the event name for a listener.
+    
+    An explicit name is used as-is; otherwise the function name is used with
+    any "on_" prefix removed, and the result is cached on the function so
+    re-registration (e.g. on extension reload) skips the work.
+    
+    Args:
+        func: Event listener function
+        name: Explicit event name, or None to derive it from the function
+        
+    Returns:
+        The event name
+    """
+    if name is not None:
+        return name
+        
+    cached = getattr(func, "_event_name_cache", None)
+    if cached is not None:
+        return cached
+        
+    event_name = func.__name__
+    
+    # Remove "on_" prefix if present
+    if event_name.startswith("on_"):
+        event_name = event_name[3:]
+        
+    # Bound methods don't accept attributes, so cache on the underlying function
+    try:
+        getattr(func, "__func__", func)._event_name_cache = event_name
+    except AttributeError:
+        pass
+        
+    return event_name
+
+def as_async_listener(listener: Callable[..., Any]) -> ListenerT:
+    """
+    Get an awaitable version of an event listener.
+    
+    Coroutine functions are returned as-is. Other callables are wrapped so
+    they run through ensure_async, and the wrapper is cached on plain
+    functions so re-registering them (e.g. on extension reload) reuses it.
+    
+    Args:
+        listener: Event listener function
+        
+    Returns:
+        A coroutine function calling the listener
+    """
+    if asyncio.iscoroutinefunction(listener):
+        return listener
+        
+    # Only cache on plain functions; bound methods share their function's
+    # __dict__, so a cached wrapper would leak across instances
+    is_function = inspect.isfunction(listener)
+    if is_function:
+        cached = listener.__dict__.get("__ensure_async_cache__")
+        if cached is not None:
+            return cached
+            
+    @functools.wraps(listener)
+    async def async_listener(*args, **kwargs):
+        return await ensure_async(listener, *args, **kwargs)
+        
+    # Direct reference back to the original, used to remove by wrapper
+    async_listener._orig_listener = listener
+        
+    if is_function:
+        listener.__ensure_async_cache__ = async_listener
+        
+    return async_listener
+
 class EventDispatcher:
     """
     Event dispatcher for Discord events.
@@ -50,8 +142,10 @@ class EventDispatcher:
         """
         Initialize the event dispatcher.
         """
-        self.listeners: Dict[str, List[ListenerT]] = {}
-        self.once_listeners: Dict[str, List[ListenerT]] = {}
+        # Listeners are keyed by the original callable so removal is O(1);
+        # dicts keep insertion order, which is the dispatch order
+        self.listeners: Dict[str, Dict[Callable, ListenerT]] = {}
+        self.once_listeners: Dict[str, Dict[Callable, ListenerT]] = {}
         
     def register_listener(
         self,
@@ -68,16 +162,16 @@ class EventDispatcher:
             once: Whether to call the listener only once
         """
         # Ensure the listener is async
-        async_listener = ensure_async(listener)
+        async_listener = as_async_listener(listener)
         
-        # Get the appropriate listener list
+        # Get the appropriate listener mapping
         if once:
-            listeners = self.once_listeners.setdefault(event_name, [])
+            listeners = self.once_listeners.setdefault(event_name, {})
         else:
-            listeners = self.listeners.setdefault(event_name, [])
+            listeners = self.listeners.setdefault(event_name, {})
             
-        # Add the listener
-        listeners.append(async_listener)
+        # Add the listener, keyed by the original callable
+        listeners[listener] = async_listener
         
     def remove_listener(
         self,
@@ -96,19 +190,29 @@ class EventDispatcher:
         Returns:
             True if the listener was removed, False otherwise
         """
-        # Get the appropriate listener list
+        # Get the appropriate listener mapping
         if once:
-            listeners = self.once_listeners.get(event_name, [])
+            listeners = self.once_listeners.get(event_name)
         else:
-            listeners = self.listeners.get(event_name, [])
+            listeners = self.listeners.get(event_name)
             
-        # Try to find and remove the listener
-        for i, l in enumerate(listeners):
-            if l == listener or getattr(l, "__wrapped__", None) == listener:
-                listeners.pop(i)
-                return True
-                
-        return False
+        if not listeners:
+            return False
+            
+        # Remove the listener by its original callable, or by the wrapper
+        # returned from as_async_listener
+        if listeners.pop(listener, None) is None:
+            original = getattr(listener, "_orig_listener", None)
+            if original is None or listeners.pop(original, None) is None:
+                return False
+            
+        # Drop the emptied mapping so teardown doesn't leave stale events behind
+        if not listeners:
+            if once:
+                del self.once_listeners[event_name]
+            else:
+                del self.listeners[event_name]
+        return True
         
     def clear_listeners(
         self,
@@ -143,19 +247,30 @@ class EventDispatcher:
             *args: Event arguments
             **kwargs: Event keyword arguments
         """
-        # Get listeners
-        normal_listeners = self.listeners.get(event_name, [])
-        once_listeners = self.once_listeners.pop(event_name, [])
-        
-        # Combine listeners
-        all_listeners = normal_listeners + once_listeners
-        
-        # Process event in batches to avoid event queue backlog
-        BATCH_SIZE = 10
-        for i in range(0, len(all_listeners), BATCH_SIZE):
-            batch = all_listeners[i:i+BATCH_SIZE]
-            tasks = [self._call_listener(listener, *args, **kwargs) for listener in batch]
-            await safe_gather(*tasks, return_exceptions=True)
+        # Get listeners, returning early for the common unhandled event
+        normal_listeners = self.listeners.get(event_name)
+        once_listeners = self.once_listeners.get(event_name)
+        if not normal_listeners and not once_listeners:
+            return
+            
+        # Combine listeners, only copying both maps when both are populated
+        if once_listeners is None:
+            all_listeners = tuple(normal_listeners.values())
+        else:
+            del self.once_listeners[event_name]
+            if normal_listeners:
+                all_listeners = (*normal_listeners.values(), *once_listeners.values())
+            else:
+                all_listeners = tuple(once_listeners.values())
+        
+        # A single listener needs no gather; _call_listener already logs errors
+        if len(all_listeners) == 1:
+            await self._call_listener(all_listeners[0], *args, **kwargs)
+            return
+        
+        # Run all listeners concurrently so the loop can interleave them
+        tasks = [self._call_listener(listener, *args, **kwargs) for listener in all_listeners]
+        await safe_gather(*tasks, return_exceptions=True)
             
     async def _call_listener(
         self,
@@ -235,41 +350,27 @@ class CompatibleBot(commands.Bot):
         # Initialize the event dispatcher
         self.event_dispatcher = EventDispatcher()
         
-        # Store the original on_error handler
-        self._original_on_error = getattr(self, "on_error", None)
-        
         # Initialize the bot
         super().__init__(*args, **kwargs)
-        
-        # Replace the on_error method
-        if hasattr(self, "on_error"):
-            self._original_on_error = self.on_error
-            self.on_error = self._safe_on_error
             
-    async def _safe_on_error(self, event_method, *args, **kwargs):
+    async def on_error(self, event_method, *args, **kwargs):
         """
         Safe on_error method with better error handling.
         
+        Defined at class level so it overrides commands.Bot.on_error through
+        normal method lookup instead of being patched onto each instance.
+        
         Args:
             event_method: Event method name
             *args: Event arguments
             **kwargs: Event keyword arguments
         """
         try:
-            # Try calling the original on_error method
-            if self._original_on_error is not None:
-                if asyncio.iscoroutinefunction(self._original_on_error):
-                    await self._original_on_error(event_method, *args, **kwargs)
-                else:
-                    self._original_on_error(event_method, *args, **kwargs)
-            else:
-                # Default error handling
-                logger.error(f"Error in {event_method}: {args} {kwargs}")
-                logger.exception("Exception:")
+            # Defer to the library's on_error handler
+            await super().on_error(event_method, *args, **kwargs)
         except Exception as e:
             # Handle errors in the error handler
-            logger.error(f"Error in on_error handler: {e}")
-            logger.exception("Exception:")
+            logger.error("Error in on_error handler for %s: %s", event_method, e, exc_info=True)
             
     def add_listener(
         self,
@@ -284,13 +385,8 @@ class CompatibleBot(commands.Bot):
             name: Event name, or None to use the function name
         """
         # Get the event name
-        if name is None:
-            name = func.__name__
-            
-            # Remove "on_" prefix if present
-            if name.startswith("on_"):
-                name = name[3:]
-                
+        name = _resolve_event_name(func, name)
+        
         # Register with both systems for compatibility
         super().add_listener(func, name)
         self.event_dispatcher.register_listener(name, func)
@@ -311,7 +407,12 @@ class CompatibleBot(commands.Bot):
         """
         # Dispatch with both systems for compatibility
         super().dispatch(event_name, *args, **kwargs)
-        asyncio.create_task(self.event_dispatcher.dispatch(event_name, *args, **kwargs))
+        
+        # Only pay for a coroutine and task when the custom dispatcher has
+        # listeners for this event (most events, e.g. on_message, have none)
+        dispatcher = self.event_dispatcher
+        if dispatcher.listeners.get(event_name) or dispatcher.once_listeners.get(event_name):
+            _spawn(dispatcher.dispatch(event_name, *args, **kwargs))
         
     def event(
         self,
@@ -330,14 +431,8 @@ class CompatibleBot(commands.Bot):
         """
         def decorator(func: T) -> T:
             # Get the event name
-            event_name = name
-            if event_name is None:
-                event_name = func.__name__
-                
-                # Remove "on_" prefix if present
-                if event_name.startswith("on_"):
-                    event_name = event_name[3:]
-                    
+            event_name = _resolve_event_name(func, name)
+            
             # Register with both systems for compatibility
             self.add_listener(func, event_name)
             return func
@@ -399,10 +494,22 @@ def register_cog_events(bot: commands.Bot, cog: commands.Cog) -> None:
     # Check if the bot has the event_dispatcher attribute
     has_dispatcher = hasattr(bot, "event_dispatcher")
     
-    # Get all methods in the cog
-    for name, method in inspect.getmembers(cog, inspect.ismethod):
-        # Check if the method is an event listener
-        if name.startswith("on_") and is_coroutine_function(method):
+    # Walk the class dictionaries for on_* names instead of resolving every
+    # attribute of the cog; subclasses come first in the MRO and win
+    seen: Set[str] = set()
+    for klass in type(cog).__mro__:
+        if klass is object:
+            continue
+        for name in vars(klass):
+            if not name.startswith("on_") or name in seen:
+                continue
+            seen.add(name)
+            
+            # Check if the method is an event listener
+            method = getattr(cog, name, None)
+            if not inspect.ismethod(method) or not is_coroutine_function(method):
+                continue
+                
             # Get the event name
             event_name = name[3:]
             
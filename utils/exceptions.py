@@ -6,10 +6,21 @@ precise error handling and user-friendly error messages.
 """
 
 import logging
-from typing import Optional, Dict, Any, Union
+import types
+from typing import Optional, Dict, Any, Callable, Mapping, Union
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only details for exceptions raised without any; code that wants
+# to add details must replace it with a dict first
+_EMPTY_DETAILS: Mapping[str, Any] = types.MappingProxyType({})
+
+def _as_id(value: Optional[Union[str, int]]) -> Optional[str]:
+    """Normalize a Discord ID to a string, or None when it is unset"""
+    if not value:
+        return None
+    return value if isinstance(value, str) else str(value)
+
 class BotBaseException(Exception):
     """Base exception class for all bot-related exceptions"""
     
@@ -22,9 +33,17 @@ class BotBaseException(Exception):
             details: Additional details for logging and debugging
         """
         self.message = message
-        self.details = details or {}
+        self.details = details if details else _EMPTY_DETAILS
         super().__init__(message)
 
+    def __reduce__(self):
+        # mappingproxy cannot be pickled; __init__ restores the shared empty
+        # mapping anyway, so leave it out of the copied state
+        cls, args, state = super().__reduce__()
+        if state and state.get('details') is _EMPTY_DETAILS:
+            state = {key: value for key, value in state.items() if key != 'details'}
+        return cls, args, state
+
 class DatabaseError(BotBaseException):
     """Exception raised for database-related errors"""
     
@@ -99,17 +118,16 @@ class CommandError(BotBaseException):
             details: Additional details for logging and debugging
         """
         self.command_name = command_name
-        self.user_id = str(user_id) if user_id else None
-        self.guild_id = str(guild_id) if guild_id else None
+        self.user_id = _as_id(user_id)
+        self.guild_id = _as_id(guild_id)
         
-        # Extend details with command info
-        full_details = details or {}
-        if command_name:
-            full_details['command_name'] = command_name
-        if user_id:
-            full_details['user_id'] = str(user_id)
-        if guild_id:
-            full_details['guild_id'] = str(guild_id)
+        # Extend details with whichever command info was provided
+        command_info = {
+            'command_name': command_name,
+            'user_id': self.user_id,
+            'guild_id': self.guild_id
+        }
+        full_details = {**(details or {}), **{k: v for k, v in command_info.items() if v}}
         
         super().__init__(message, full_details)
 
@@ -154,13 +172,65 @@ class ExternalServiceError(BotBaseException):
         self.operation = operation
         
         # Extend details with service info
-        full_details = details or {}
-        full_details['service_name'] = service_name
-        if operation:
-            full_details['operation'] = operation
+        full_details = {
+            **(details or {}),
+            'service_name': service_name,
+            **({'operation': operation} if operation else {})
+        }
         
         super().__init__(message, full_details)
 
+def _format_premium_error(exception: PremiumFeatureError) -> str:
+    return (
+        f"⚠️ **Premium Feature Required**\n"
+        f"The feature '{exception.feature}' requires the "
+        f"`{exception.required_tier}` tier, but your server has the "
+        f"`{exception.guild_tier}` tier.\n"
+        f"Use `/premium info` to learn more about upgrading."
+    )
+
+def _format_database_error(exception: DatabaseError) -> str:
+    return (
+        f"⚠️ **Database Error**\n"
+        f"{exception.message}\n"
+        f"Please try again later. If the issue persists, contact support."
+    )
+
+def _format_command_error(exception: CommandError) -> str:
+    return (
+        f"⚠️ **Command Error**\n"
+        f"{exception.message}"
+    )
+
+def _format_configuration_error(exception: ConfigurationError) -> str:
+    return (
+        f"⚠️ **Configuration Error**\n"
+        f"{exception.message}"
+    )
+
+def _format_external_service_error(exception: ExternalServiceError) -> str:
+    return (
+        f"⚠️ **{exception.service_name} Service Error**\n"
+        f"{exception.message}\n"
+        f"Please try again later. If the issue persists, contact support."
+    )
+
+def _format_bot_error(exception: BotBaseException) -> str:
+    return (
+        f"⚠️ **Error**\n"
+        f"{exception.message}"
+    )
+
+# User-facing formatter per exception class, resolved by exact type first
+_FORMATTERS: Dict[type, Callable[[Any], str]] = {
+    PremiumFeatureError: _format_premium_error,
+    DatabaseError: _format_database_error,
+    CommandError: _format_command_error,
+    ConfigurationError: _format_configuration_error,
+    ExternalServiceError: _format_external_service_error,
+    BotBaseException: _format_bot_error,
+}
+
 def format_user_error_message(exception: Exception) -> str:
     """
     Format an exception into a user-friendly error message.
@@ -172,54 +242,23 @@ def format_user_error_message(exception: Exception) -> str:
         str: A formatted error message suitable for displaying to users
     """
     # Handle our custom exceptions with special formatting
-    if isinstance(exception, PremiumFeatureError):
-        return (
-            f"⚠️ **Premium Feature Required**\n"
-            f"The feature '{exception.feature}' requires the "
-            f"`{exception.required_tier}` tier, but your server has the "
-            f"`{exception.guild_tier}` tier.\n"
-            f"Use `/premium info` to learn more about upgrading."
-        )
-    
-    elif isinstance(exception, DatabaseError):
-        return (
-            f"⚠️ **Database Error**\n"
-            f"{exception.message}\n"
-            f"Please try again later. If the issue persists, contact support."
-        )
-    
-    elif isinstance(exception, CommandError):
-        return (
-            f"⚠️ **Command Error**\n"
-            f"{exception.message}"
-        )
-    
-    elif isinstance(exception, ConfigurationError):
-        return (
-            f"⚠️ **Configuration Error**\n"
-            f"{exception.message}"
-        )
-    
-    elif isinstance(exception, ExternalServiceError):
-        return (
-            f"⚠️ **{exception.service_name} Service Error**\n"
-            f"{exception.message}\n"
-            f"Please try again later. If the issue persists, contact support."
-        )
+    formatter = _FORMATTERS.get(type(exception))
+    if formatter is not None:
+        return formatter(exception)
     
-    elif isinstance(exception, BotBaseException):
-        return (
-            f"⚠️ **Error**\n"
-            f"{exception.message}"
-        )
+    # Subclasses of our exceptions use the closest registered formatter
+    if isinstance(exception, BotBaseException):
+        for klass in type(exception).__mro__:
+            formatter = _FORMATTERS.get(klass)
+            if formatter is not None:
+                return formatter(exception)
     
     # Handle generic exceptions
-    else:
-        return (
-            f"⚠️ **Unexpected Error**\n"
-            f"An error occurred: {str(exception)}\n"
-            f"Please try again later. If the issue persists, contact support."
-        )
+    return (
+        f"⚠️ **Unexpected Error**\n"
+        f"An error occurred: {str(exception)}\n"
+        f"Please try again later. If the issue persists, contact support."
+    )
 
 def log_exception(exception: Exception, 
                  context: Optional[Dict[str, Any]] = None,
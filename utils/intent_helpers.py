@@ -5,24 +5,60 @@ This module provides helper functions for working with Discord intents,
 compatible with both discord.py and py-cord.
 """
 
+import functools
 import logging
 from typing import Any, Dict, List, Optional, Tuple, Union, TypeVar, cast
 
 # Try importing different libraries
 try:
-    import discord
     from discord import Intents
     DISCORD_AVAILABLE = True
 except ImportError:
     DISCORD_AVAILABLE = False
 
 # Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Valid intent names accepted by get_intents_by_name
+VALID_INTENTS = frozenset({
+    'guilds', 'members', 'bans', 'emojis', 'integrations',
+    'webhooks', 'invites', 'voice_states', 'presences',
+    'messages', 'guild_messages', 'dm_messages', 'reactions',
+    'guild_reactions', 'dm_reactions', 'typing', 'guild_typing',
+    'dm_typing', 'message_content', 'scheduled_events'
+})
+
+# Intent flags supported by the installed library, probed once at import
+_INTENT_FLAGS: frozenset = frozenset()
+if DISCORD_AVAILABLE:
+    if hasattr(Intents, 'VALID_FLAGS'):
+        _INTENT_FLAGS = frozenset(Intents.VALID_FLAGS)
+    else:
+        _INTENT_FLAGS = frozenset(n for n in dir(Intents) if not n.startswith('_'))
+
+# Flag bit mask for every intent known to the installed library
+_FLAG_BITS: Dict[str, int] = {}
+if DISCORD_AVAILABLE:
+    _FLAG_BITS = dict(getattr(Intents, 'VALID_FLAGS', {}))
+
+# Flag bit for each valid intent name known to the installed library
+_INTENT_BITS: Dict[str, int] = {
+    name: bit for name, bit in _FLAG_BITS.items() if name in VALID_INTENTS
+}
+
+def _copy_intents(intents: Any) -> Any:
+    """Return an independent copy of cached intents so callers may mutate it"""
+    if intents is None:
+        return None
+    return type(intents)._from_value(intents.value)
+
+def _reset_intent_cache() -> None:
+    """Clear the memoized intents (for tests that swap the library out)"""
+    _build_default_intents.cache_clear()
+    _build_minimal_intents.cache_clear()
+    _build_all_intents.cache_clear()
+    _intents_value_for.cache_clear()
+
 def get_default_intents() -> Any:
     """
     Get default intents for Discord bot with compatibility for different versions.
@@ -30,6 +66,11 @@ def get_default_intents() -> Any:
     Returns:
         The default intents or None if Discord is not available
     """
+    return _copy_intents(_build_default_intents())
+
+@functools.lru_cache(maxsize=1)
+def _build_default_intents() -> Any:
+    """Build the default intents once; see get_default_intents"""
     if not DISCORD_AVAILABLE:
         logger.error("Discord library not available. Cannot get default intents.")
         return None
@@ -45,18 +86,11 @@ def get_default_intents() -> Any:
         intents.guild_reactions = True
         intents.guilds = True
         
-        # Try to enable newer intents if available
-        try:
+        # Enable newer intents if the library supports them
+        if 'presences' in _INTENT_FLAGS:
             intents.presences = True
-        except Exception:
-            # Presences might be unavailable in some versions
-            pass
-            
-        try:
+        if 'auto_moderation' in _INTENT_FLAGS:
             intents.auto_moderation = True
-        except Exception:
-            # Auto moderation might be unavailable in some versions
-            pass
             
         return intents
     except Exception as e:
@@ -64,19 +98,16 @@ def get_default_intents() -> Any:
         
         # Try alternate method for older versions
         try:
-            intents = discord.Intents(
+            intents = Intents(
                 guilds=True,
                 members=True,
                 messages=True,
                 reactions=True
             )
             
-            # Try to set message content for newer versions
-            try:
+            # Set message content for newer versions
+            if 'message_content' in _INTENT_FLAGS:
                 intents.message_content = True
-            except Exception:
-                # Message content might be unavailable in some versions
-                pass
                 
             return intents
         except Exception as alt_e:
@@ -84,7 +115,7 @@ def get_default_intents() -> Any:
             
             # Try to get all intents as last resort
             try:
-                return discord.Intents.all()
+                return Intents.all()
             except Exception:
                 # Return None if nothing works
                 return None
@@ -96,6 +127,11 @@ def get_minimal_intents() -> Any:
     Returns:
         The minimal intents or None if Discord is not available
     """
+    return _copy_intents(_build_minimal_intents())
+
+@functools.lru_cache(maxsize=1)
+def _build_minimal_intents() -> Any:
+    """Build the minimal intents once; see get_minimal_intents"""
     if not DISCORD_AVAILABLE:
         logger.error("Discord library not available. Cannot get minimal intents.")
         return None
@@ -119,7 +155,7 @@ def get_minimal_intents() -> Any:
         
         # Try alternate method for older versions
         try:
-            intents = discord.Intents(
+            intents = Intents(
                 guilds=True,
                 messages=True
             )
@@ -129,11 +165,41 @@ def get_minimal_intents() -> Any:
             
             # Try to get default intents as last resort
             try:
-                return discord.Intents.default()
+                return Intents.default()
             except Exception:
                 # Return None if nothing works
                 return None
 
+def get_all_intents() -> Any:
+    """
+    Get intents with every flag enabled.
+    
+    Returns:
+        All intents or None if Discord is not available
+    """
+    return _copy_intents(_build_all_intents())
+
+@functools.lru_cache(maxsize=1)
+def _build_all_intents() -> Any:
+    """Build the all-enabled intents once; see get_all_intents"""
+    if not DISCORD_AVAILABLE:
+        logger.error("Discord library not available. Cannot get all intents.")
+        return None
+        
+    try:
+        return Intents.all()
+    except Exception as e:
+        logger.error(f"Error creating all intents: {e}")
+        return None
+
+@functools.lru_cache(maxsize=32)
+def _intents_value_for(names: frozenset) -> int:
+    """OR together the flag bits for a set of lowercased intent names"""
+    value = 0
+    for name in VALID_INTENTS.intersection(names):
+        value |= _INTENT_BITS.get(name, 0)
+    return value
+
 def get_intents_by_name(intent_names: List[str]) -> Any:
     """
     Get intents by name for Discord bot with compatibility for different versions.
@@ -149,25 +215,80 @@ def get_intents_by_name(intent_names: List[str]) -> Any:
         return None
         
     try:
+        names = frozenset([n.lower() for n in intent_names])
+        
+        if _INTENT_BITS:
+            # Build the intents in one step from the cached flag bits
+            return Intents._from_value(_intents_value_for(names))
+        
         # Create empty intents
-        intents = discord.Intents.none()
-        
-        # Valid intent names to check for
-        valid_intents = [
-            'guilds', 'members', 'bans', 'emojis', 'integrations',
-            'webhooks', 'invites', 'voice_states', 'presences',
-            'messages', 'guild_messages', 'dm_messages', 'reactions',
-            'guild_reactions', 'dm_reactions', 'typing', 'guild_typing',
-            'dm_typing', 'message_content', 'scheduled_events'
-        ]
-        
-        # Enable specified intents
-        for name in intent_names:
-            name = name.lower()
-            if name in valid_intents:
-                setattr(intents, name, True)
+        intents = Intents.none()
+        
+        # Enable the specified intents that are valid
+        for name in VALID_INTENTS.intersection(names):
+            setattr(intents, name, True)
                 
         return intents
     except Exception as e:
         logger.error(f"Error creating intents by name: {e}")
-        return get_default_intents()  # Fall back to defaults
\ No newline at end of file
+        return get_default_intents()  # Fall back to defaults
+
+
+def create_intents(**flags: bool) -> Any:
+    """
+    Create intents with exactly the given flags enabled.
+    
+    Args:
+        **flags: Intent names mapped to whether they should be enabled
+        
+    Returns:
+        The created intents or None if Discord is not available
+    """
+    if not DISCORD_AVAILABLE:
+        logger.error("Discord library not available. Cannot create intents.")
+        return None
+        
+    if not _FLAG_BITS:
+        # No flag bit table on this library version, set each flag directly
+        intents = Intents.none()
+        for name, enabled in flags.items():
+            if name not in _INTENT_FLAGS:
+                logger.warning(f"Unknown intent '{name}' for this Discord library version")
+                continue
+            setattr(intents, name, enabled)
+        return intents
+        
+    # OR the precomputed masks of the enabled flags into a single value
+    value = 0
+    for name, enabled in flags.items():
+        if not enabled:
+            continue
+        bit = _FLAG_BITS.get(name)
+        if bit is None:
+            logger.warning(f"Unknown intent '{name}' for this Discord library version")
+            continue
+        value |= bit
+        
+    return Intents._from_value(value)
+
+def merge_intents(*intents_list: Any) -> Any:
+    """
+    Merge several intents objects, enabling every flag enabled in any of them.
+    
+    Args:
+        *intents_list: Intents objects to merge (None entries are ignored)
+        
+    Returns:
+        The merged intents or None if Discord is not available
+    """
+    if not DISCORD_AVAILABLE:
+        logger.error("Discord library not available. Cannot merge intents.")
+        return None
+        
+    # Intents are bitfields, so merging is a plain OR of their raw values
+    merged = 0
+    for intents in intents_list:
+        if intents is not None:
+            merged |= intents.value
+            
+    return Intents._from_value(merged)
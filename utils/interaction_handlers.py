@@ -5,14 +5,12 @@ This module provides utility functions for handling Discord interactions,
 with compatibility between different Discord library versions.
 """
 
+import asyncio
+import contextlib
+import inspect
 import logging
-from typing import Any, Dict, List, Optional, Union, Callable, TypeVar, cast
+from typing import Any, Dict, List, Optional, Tuple, Union, Callable, TypeVar, cast
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 # Import discord compatibility module
@@ -23,8 +21,277 @@ T = TypeVar('T')
 InteractionT = TypeVar('InteractionT')
 ContextT = TypeVar('ContextT')
 
+# Interaction capabilities of the installed library, probed once at import
+# instead of with hasattr on every response
+_INTERACTION_CLS = getattr(discord, 'Interaction', None)
+_HAS_FOLLOWUP = _INTERACTION_CLS is not None and hasattr(_INTERACTION_CLS, 'followup')
+_HAS_RESPONSE_SEND = hasattr(getattr(discord, 'InteractionResponse', None), 'send_message')
+
+# Library types that wrap an interaction (py-cord's ApplicationContext does too)
+_INTERACTION_TYPES = tuple(
+    cls for cls in (_INTERACTION_CLS, getattr(discord, 'ApplicationContext', None))
+    if cls is not None
+)
+
+# Name of Interaction's edit-original method (older versions use _message)
+_EDIT_ORIGINAL = next(
+    (name for name in ('edit_original_response', 'edit_original_message')
+     if hasattr(_INTERACTION_CLS, name)),
+    None
+)
+
+# Prefix-command context type, for is_context's fast path
+_CONTEXT_CLS = getattr(commands, 'Context', None)
+_CONTEXT_TYPES = tuple(cls for cls in (_CONTEXT_CLS,) if cls is not None)
+
+async def _respond_with_prebuilt_kwargs(interaction: Any, kwargs: Dict[str, Any], initial: bool,
+                                        response: Optional[Any] = None) -> Any:
+    """
+    Send already-assembled send arguments as the initial response or a followup.
+    
+    Args:
+        interaction: The interaction (or application context) to respond to
+        kwargs: The complete keyword arguments for the send call
+        initial: Whether the interaction has not been responded to yet
+        response: interaction.response, if the caller already looked it up
+        
+    Returns:
+        Whatever the underlying send returned
+    """
+    if initial and _HAS_RESPONSE_SEND:
+        if response is None:
+            response = interaction.response
+        send = response.send_message
+    elif _HAS_FOLLOWUP:
+        send = interaction.followup.send
+    else:
+        raise TypeError(f"Cannot respond to interaction of type: {type(interaction)}")
+    return await send(**kwargs)
+
+# Per-interaction [lock, users] so concurrent responders can't both see
+# is_done() == False and race to send the initial response or defer
+_RESPONSE_LOCKS: Dict[int, List[Any]] = {}
+
+@contextlib.asynccontextmanager
+async def _response_lock(interaction: Any):
+    """
+    Hold the interaction's response lock, dropping it once nobody waits on it.
+    
+    Args:
+        interaction: The interaction (or application context) being responded to
+    """
+    # Application contexts wrap the interaction; lock on the interaction itself
+    key = id(getattr(interaction, 'interaction', None) or interaction)
+    entry = _RESPONSE_LOCKS.get(key)
+    if entry is None:
+        entry = _RESPONSE_LOCKS[key] = [asyncio.Lock(), 0]
+    entry[1] += 1
+    try:
+        async with entry[0]:
+            yield
+    finally:
+        entry[1] -= 1
+        if not entry[1]:
+            del _RESPONSE_LOCKS[key]
+
+async def _respond_serialized(interaction: Any, kwargs: Dict[str, Any], response: Any) -> Tuple[bool, Any]:
+    """
+    Check the acknowledgement state and send under the interaction's lock.
+    
+    Args:
+        interaction: The interaction (or application context) to respond to
+        kwargs: The complete keyword arguments for the send call
+        response: interaction.response
+        
+    Returns:
+        Whether this was the initial response, and what the send returned
+    """
+    async with _response_lock(interaction):
+        initial = not response.is_done()
+        return initial, await _respond_with_prebuilt_kwargs(interaction, kwargs, initial, response)
+
+async def safely_respond_to_interaction(interaction: Any,
+                                        content: Optional[str] = None,
+                                        ephemeral: bool = False,
+                                        embed: Optional[Any] = None,
+                                        embeds: Optional[List[Any]] = None,
+                                        file: Optional[Any] = None,
+                                        files: Optional[List[Any]] = None,
+                                        view: Optional[Any] = None,
+                                        allowed_mentions: Optional[Any] = None,
+                                        **kwargs) -> bool:
+    """
+    Respond to an interaction, using a followup if it was already responded to.
+    
+    Args:
+        interaction: The interaction (or application context) to respond to
+        content: The content to send
+        ephemeral: Whether the response should be ephemeral
+        embed: An embed to send
+        embeds: A list of embeds to send (takes precedence over embed)
+        file: A file to send
+        files: A list of files to send (takes precedence over file)
+        view: A view to attach
+        allowed_mentions: Allowed mentions for the message
+        **kwargs: Additional arguments to pass to the send method
+        
+    Returns:
+        Whether the response was sent
+    """
+    # Build the send arguments in one pass; the list forms win over singles
+    response_kwargs: Dict[str, Any] = {
+        name: value for name, value in (
+            ('content', content),
+            ('embed', embed if embeds is None else None),
+            ('embeds', embeds),
+            ('file', file if files is None else None),
+            ('files', files),
+            ('view', view),
+            ('allowed_mentions', allowed_mentions),
+            ('ephemeral', ephemeral),
+        ) if value is not None
+    }
+    if kwargs:
+        response_kwargs.update(kwargs)
+        
+    try:
+        await _respond_serialized(interaction, response_kwargs, interaction.response)
+        return True
+    except Exception as e:
+        logger.error("Failed to respond to interaction: %s", e, exc_info=True)
+        return False
+
+# Sentinel for attribute probes; getattr with a default avoids hasattr's
+# exception round-trip when the attribute is missing (the common case here)
+_MISSING = object()
+
+# Kind of each concrete type seen by _classify
+_INTERACTION = 'interaction'
+_CONTEXT = 'context'
+_OTHER = 'other'
+_KIND_CACHE: Dict[type, str] = {}
+
+def _classify(obj: Any) -> str:
+    """
+    Classify an object as an interaction, a context or neither.
+    
+    The answer is cached per type when the class itself decides it; objects
+    that only gain the attributes per instance (e.g. mocks) are probed each time.
+    """
+    cls = type(obj)
+    kind = _KIND_CACHE.get(cls)
+    if kind is not None:
+        return kind
+        
+    if issubclass(cls, _INTERACTION_TYPES) or hasattr(cls, 'response'):
+        kind = _INTERACTION
+    elif hasattr(cls, 'send'):
+        kind = _CONTEXT
+    else:
+        if getattr(getattr(obj, 'response', None), 'send_message', None) is not None:
+            return _INTERACTION
+        return _CONTEXT if getattr(obj, 'send', _MISSING) is not _MISSING else _OTHER
+        
+    _KIND_CACHE[cls] = kind
+    return kind
+
+async def defer_interaction(interaction: Any) -> bool:
+    """
+    Safely defer an interaction that has not been responded to yet.
+    
+    Args:
+        interaction: The interaction to defer
+        
+    Returns:
+        True if deferred successfully, False otherwise
+    """
+    try:
+        # Same lock as the send path, so a defer can't race a response
+        async with _response_lock(interaction):
+            if not interaction.response.is_done():
+                await interaction.response.defer()
+                return True
+    except Exception as e:
+        logger.error("Failed to defer interaction: %s", e)
+    return False
+
+async def _send_interaction(interaction: Any, content: Optional[str], kwargs: Dict[str, Any],
+                            return_message: bool) -> Any:
+    """hybrid_send for interactions: initial response, else a followup"""
+    # Our kwargs are already the send arguments, so hand them over as-is
+    if content is not None:
+        kwargs['content'] = content
+    
+    # Respond initially, or with a followup if it has been responded to
+    kwargs.setdefault('ephemeral', False)
+    initial, message = await _respond_serialized(interaction, kwargs, interaction.response)
+    if not initial:
+        # Followups return the message they sent
+        return message
+        
+    # Fetching the message is an extra API round-trip, so only on request
+    if not return_message:
+        return None
+        
+    # Try to get the original response (older versions name it original_message)
+    original = getattr(interaction, 'original_response', _MISSING)
+    if original is _MISSING:
+        original = getattr(interaction, 'original_message', _MISSING)
+    if original is not _MISSING:
+        try:
+            return await original()
+        except (AttributeError, TypeError):
+            return None
+    return None
+
+# Interaction-only send arguments that the installed Context.send rejects
+_INTERACTION_ONLY = frozenset(('ephemeral', 'thinking'))
+
+def _unsupported_context_kwargs() -> frozenset:
+    """Return the interaction-only kwargs that Context.send does not accept"""
+    try:
+        params = inspect.signature(_CONTEXT_TYPES[0].send).parameters
+    except (IndexError, TypeError, ValueError):
+        return _INTERACTION_ONLY
+    if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()):
+        return frozenset()
+    return _INTERACTION_ONLY.difference(params)
+
+_CONTEXT_DROP_KWARGS = _unsupported_context_kwargs()
+
+async def _send_context(ctx: Any, content: Optional[str], kwargs: Dict[str, Any],
+                        return_message: bool) -> Any:
+    """hybrid_send for contexts"""
+    if not _CONTEXT_DROP_KWARGS.isdisjoint(kwargs):
+        kwargs = {k: v for k, v in kwargs.items() if k not in _CONTEXT_DROP_KWARGS}
+    return await ctx.send(content, **kwargs)
+
+# hybrid_send's sender per kind, and resolved per concrete type
+_SENDERS: Dict[str, Callable] = {_INTERACTION: _send_interaction, _CONTEXT: _send_context}
+_SEND_DISPATCH: Dict[type, Optional[Callable]] = {}
+
+def _resolve_sender(obj: Any) -> Optional[Callable]:
+    """Return hybrid_send's sender for obj, cached by type when the class decides it"""
+    cls = type(obj)
+    sender = _SEND_DISPATCH.get(cls, _MISSING)
+    if sender is not _MISSING:
+        return sender
+        
+    # Real interactions are the common case; one isinstance settles them
+    if isinstance(obj, _INTERACTION_TYPES):
+        sender = _send_interaction
+    else:
+        sender = _SENDERS.get(_classify(obj))
+        if cls not in _KIND_CACHE:
+            # Duck-typed per instance, so the answer can't be reused
+            return sender
+    _SEND_DISPATCH[cls] = sender
+    return sender
+
 async def hybrid_send(ctx_or_interaction: Any, 
                      content: Optional[str] = None, 
+                     *,
+                     return_message: bool = False,
                      **kwargs) -> Any:
     """
     Send a message to either a Context or Interaction with compatibility.
@@ -32,54 +299,24 @@ async def hybrid_send(ctx_or_interaction: Any,
     Args:
         ctx_or_interaction: The context or interaction to send to
         content: The content to send
+        return_message: Whether to fetch the message sent as an initial
+            interaction response (costs an extra API request)
         **kwargs: Additional arguments to pass to the send method
         
     Returns:
         The message sent or None
     """
+    if ctx_or_interaction is None:
+        return None
+        
     try:
-        # Check if it's an interaction
-        if hasattr(ctx_or_interaction, 'response') and hasattr(ctx_or_interaction.response, 'send_message'):
-            # Check if the interaction has been responded to
-            if not getattr(ctx_or_interaction.response, '_responded', False):
-                # It's an interaction that hasn't been responded to
-                if 'ephemeral' in kwargs:
-                    ephemeral = kwargs.pop('ephemeral')
-                else:
-                    ephemeral = False
-                    
-                await ctx_or_interaction.response.send_message(content, ephemeral=ephemeral, **kwargs)
-                
-                # Try to get the original response
-                if hasattr(ctx_or_interaction, 'original_response') or hasattr(ctx_or_interaction, 'original_message'):
-                    try:
-                        return await ctx_or_interaction.original_response()
-                    except AttributeError:
-                        try:
-                            return await ctx_or_interaction.original_message()
-                        except (AttributeError, TypeError):
-                            return None
-                return None
-            elif hasattr(ctx_or_interaction, 'followup') and hasattr(ctx_or_interaction.followup, 'send'):
-                # It's an interaction that has been responded to
-                return await ctx_or_interaction.followup.send(content, **kwargs)
-        # Check if it's a context
-        elif hasattr(ctx_or_interaction, 'send'):
-            # It's a context
-            return await ctx_or_interaction.send(content, **kwargs)
-        else:
-            logger.error(f"Unknown context or interaction type: {type(ctx_or_interaction)}")
+        sender = _resolve_sender(ctx_or_interaction)
+        if sender is None:
+            logger.error("Unknown context or interaction type: %s", type(ctx_or_interaction))
             return None
+        return await sender(ctx_or_interaction, content, kwargs, return_message)
     except Exception as e:
-        logger.error(f"Error sending message: {e}")
-        # Try to send a basic message as fallback
-        try:
-            if hasattr(ctx_or_interaction, 'send'):
-                return await ctx_or_interaction.send(f"Error: {e}", **kwargs)
-            elif hasattr(ctx_or_interaction, 'followup') and hasattr(ctx_or_interaction.followup, 'send'):
-                return await ctx_or_interaction.followup.send(f"Error: {e}", **kwargs)
-        except Exception:
-            pass
+        logger.error("Error sending message: %s", e, exc_info=True)
         return None
 
 async def hybrid_defer(ctx_or_interaction: Any, 
@@ -97,22 +334,29 @@ async def hybrid_defer(ctx_or_interaction: Any,
         Whether the defer was successful
     """
     try:
+        if isinstance(ctx_or_interaction, _INTERACTION_TYPES):
+            await ctx_or_interaction.response.defer(ephemeral=ephemeral, **kwargs)
+            return True
+            
         # Check if it's an interaction
-        if hasattr(ctx_or_interaction, 'response') and hasattr(ctx_or_interaction.response, 'defer'):
+        defer = getattr(getattr(ctx_or_interaction, 'response', None), 'defer', _MISSING)
+        if defer is not _MISSING:
             # It's an interaction
-            await ctx_or_interaction.response.defer(ephemeral=ephemeral, **kwargs)
+            await defer(ephemeral=ephemeral, **kwargs)
             return True
+            
         # Check if it's a context (contexts don't need to be deferred)
-        elif hasattr(ctx_or_interaction, 'typing'):
+        typing = getattr(ctx_or_interaction, 'typing', _MISSING)
+        if typing is not _MISSING:
             # For contexts, we can just use typing as indication of processing
-            async with ctx_or_interaction.typing():
+            async with typing():
                 pass
             return True
         else:
-            logger.error(f"Unknown context or interaction type: {type(ctx_or_interaction)}")
+            logger.error("Unknown context or interaction type: %s", type(ctx_or_interaction))
             return False
     except Exception as e:
-        logger.error(f"Error deferring: {e}")
+        logger.error("Error deferring: %s", e)
         return False
 
 async def hybrid_edit(ctx_or_interaction: Any,
@@ -130,22 +374,20 @@ async def hybrid_edit(ctx_or_interaction: Any,
         The edited message or None
     """
     try:
-        # Check if it's an interaction
-        if hasattr(ctx_or_interaction, 'edit_original_response'):
-            # It's an interaction
-            return await ctx_or_interaction.edit_original_response(content=content, **kwargs)
-        elif hasattr(ctx_or_interaction, 'edit_original_message'):
-            # Alternate naming in some versions
-            return await ctx_or_interaction.edit_original_message(content=content, **kwargs)
-        # Check if it's a context or message
-        elif hasattr(ctx_or_interaction, 'edit'):
-            # It's a context or message
-            return await ctx_or_interaction.edit(content=content, **kwargs)
-        else:
-            logger.error(f"Unknown context or interaction type: {type(ctx_or_interaction)}")
-            return None
+        if _EDIT_ORIGINAL is not None and isinstance(ctx_or_interaction, _INTERACTION_CLS):
+            return await getattr(ctx_or_interaction, _EDIT_ORIGINAL)(content=content, **kwargs)
+            
+        # Interactions (edit_original_message is the alternate naming in some
+        # versions), then contexts or messages
+        for name in ('edit_original_response', 'edit_original_message', 'edit'):
+            edit = getattr(ctx_or_interaction, name, _MISSING)
+            if edit is not _MISSING:
+                return await edit(content=content, **kwargs)
+                
+        logger.error("Unknown context or interaction type: %s", type(ctx_or_interaction))
+        return None
     except Exception as e:
-        logger.error(f"Error editing message: {e}")
+        logger.error("Error editing message: %s", e)
         return None
 
 def is_interaction(ctx_or_interaction: Any) -> bool:
@@ -158,10 +400,11 @@ def is_interaction(ctx_or_interaction: Any) -> bool:
     Returns:
         Whether the object is an interaction
     """
-    return (
-        hasattr(ctx_or_interaction, 'response') and 
-        hasattr(ctx_or_interaction.response, 'send_message')
-    )
+    # Exact-type hit first: a pointer compare, no MRO walk
+    cls = type(ctx_or_interaction)
+    if cls is _INTERACTION_CLS or isinstance(ctx_or_interaction, _INTERACTION_TYPES):
+        return True
+    return _classify(ctx_or_interaction) is _INTERACTION
 
 def is_context(ctx_or_interaction: Any) -> bool:
     """
@@ -173,10 +416,35 @@ def is_context(ctx_or_interaction: Any) -> bool:
     Returns:
         Whether the object is a context
     """
-    return (
-        hasattr(ctx_or_interaction, 'send') and 
-        not is_interaction(ctx_or_interaction)
-    )
+    cls = type(ctx_or_interaction)
+    if cls is _CONTEXT_CLS or isinstance(ctx_or_interaction, _CONTEXT_TYPES):
+        return True
+    return _classify(ctx_or_interaction) is _CONTEXT
+
+# Attribute names to read per concrete type, narrowed to the one the class
+# defines once it has been seen (see _lookup_attr)
+_USER_ATTRS: Dict[type, Tuple[str, ...]] = {}
+_GUILD_ID_ATTRS: Dict[type, Tuple[str, ...]] = {}
+
+def _lookup_attr(cache: Dict[type, Tuple[str, ...]], obj: Any, names: Tuple[str, ...]) -> Optional[Any]:
+    """
+    Return the first non-None attribute of obj among names.
+    
+    The first name the class itself defines is cached for the type, so later
+    lookups are a single getattr. Classes that define none of them (attributes
+    set per instance) keep probing every name.
+    """
+    cls = type(obj)
+    resolved = cache.get(cls)
+    if resolved is None:
+        resolved = next(((n,) for n in names if getattr(cls, n, None) is not None), names)
+        cache[cls] = resolved
+        
+    for name in resolved:
+        value = getattr(obj, name, None)
+        if value is not None:
+            return value
+    return None
 
 def get_user(ctx_or_interaction: Any) -> Optional[Any]:
     """
@@ -188,10 +456,23 @@ def get_user(ctx_or_interaction: Any) -> Optional[Any]:
     Returns:
         The user or None
     """
-    if is_interaction(ctx_or_interaction):
-        return getattr(ctx_or_interaction, 'user', None)
-    else:
-        return getattr(ctx_or_interaction, 'author', None)
+    return _lookup_attr(_USER_ATTRS, ctx_or_interaction, ('user', 'author'))
+
+def get_interaction_user(ctx_or_interaction: Any) -> Optional[Any]:
+    """
+    Get the invoking user, checking the library types before any probing.
+    
+    Args:
+        ctx_or_interaction: The context or interaction
+        
+    Returns:
+        The user or None
+    """
+    if isinstance(ctx_or_interaction, _INTERACTION_TYPES):
+        return ctx_or_interaction.user
+    if isinstance(ctx_or_interaction, _CONTEXT_TYPES):
+        return ctx_or_interaction.author
+    return get_user(ctx_or_interaction)
 
 def get_guild(ctx_or_interaction: Any) -> Optional[Any]:
     """
@@ -203,8 +484,25 @@ def get_guild(ctx_or_interaction: Any) -> Optional[Any]:
     Returns:
         The guild or None
     """
+    # Interactions and contexts both expose .guild, so no dispatch is needed
     return getattr(ctx_or_interaction, 'guild', None)
 
+def get_guild_id(ctx_or_interaction: Any) -> Optional[int]:
+    """
+    Get the guild ID from a context or interaction.
+    
+    Args:
+        ctx_or_interaction: The context or interaction
+        
+    Returns:
+        The guild ID or None
+    """
+    guild_id = _lookup_attr(_GUILD_ID_ATTRS, ctx_or_interaction, ('guild_id',))
+    if guild_id is None:
+        # Contexts only expose the guild itself
+        guild_id = getattr(get_guild(ctx_or_interaction), 'id', None)
+    return guild_id
+
 def get_channel(ctx_or_interaction: Any) -> Optional[Any]:
     """
     Get the channel from a context or interaction.
@@ -219,7 +517,8 @@ def get_channel(ctx_or_interaction: Any) -> Optional[Any]:
 
 # Export for easy importing
 __all__ = [
+    'safely_respond_to_interaction', 'defer_interaction',
     'hybrid_send', 'hybrid_defer', 'hybrid_edit',
     'is_interaction', 'is_context',
-    'get_user', 'get_guild', 'get_channel'
+    'get_user', 'get_interaction_user', 'get_guild', 'get_guild_id', 'get_channel'
 ]
\ No newline at end of file